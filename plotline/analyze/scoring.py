@@ -7,9 +7,20 @@ scores per segment. Generates human-readable delivery labels.
 
 from __future__ import annotations
 
+import math
 from pathlib import Path
 from typing import Any
 
+# Metric names, shared by normalized dicts and delivery weight dicts
+_METRIC_KEYS = (
+    "energy",
+    "pitch_variation",
+    "speech_rate",
+    "pause_weight",
+    "spectral_brightness",
+    "voice_texture",
+)
+
 
 def normalize_metrics(
     raw_metrics: list[dict[str, Any]],
@@ -66,36 +77,40 @@ def normalize_metrics(
     return normalized
 
 
+def sum_weights(weights: dict[str, float]) -> float:
+    """Sum the delivery weights used by the composite score.
+
+    Args:
+        weights: Weight dict from config
+
+    Returns:
+        Total weight across all scored metrics
+    """
+    return math.fsum(weights.get(key, 0) for key in _METRIC_KEYS)
+
+
 def compute_composite_score(
     normalized: dict[str, float],
     weights: dict[str, float],
+    total_weight: float | None = None,
 ) -> float:
     """Compute weighted composite delivery score.
 
     Args:
         normalized: Normalized metrics dict
         weights: Weight dict from config
+        total_weight: Precomputed sum_weights(weights), for callers scoring
+            many segments with the same weights
 
     Returns:
         Composite score 0-1
     """
+    if total_weight is None:
+        total_weight = sum_weights(weights)
+
     score = 0.0
-    total_weight = 0.0
-
-    metric_keys = [
-        ("energy", "energy"),
-        ("pitch_variation", "pitch_variation"),
-        ("speech_rate", "speech_rate"),
-        ("pause_weight", "pause_weight"),
-        ("spectral_brightness", "spectral_brightness"),
-        ("voice_texture", "voice_texture"),
-    ]
-
-    for norm_key, weight_key in metric_keys:
-        w = weights.get(weight_key, 0)
-        v = normalized.get(norm_key, 0)
-        score += v * w
-        total_weight += w
+    for key in _METRIC_KEYS:
+        score += normalized.get(key, 0) * weights.get(key, 0)
 
     if total_weight > 0:
         score = score / total_weight
@@ -179,11 +194,12 @@ def add_scores_to_delivery(
 
     raw_metrics = [s.get("raw", {}) for s in segments]
     normalized = normalize_metrics(raw_metrics)
+    total_weight = sum_weights(weights)
 
     for i, seg in enumerate(segments):
         if i < len(normalized):
             seg["normalized"] = normalized[i]
-            seg["composite_score"] = compute_composite_score(normalized[i], weights)
+            seg["composite_score"] = compute_composite_score(normalized[i], weights, total_weight)
             seg["delivery_label"] = generate_delivery_label(normalized[i], seg.get("raw", {}))
 
     return delivery
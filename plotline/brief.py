@@ -12,6 +12,16 @@ from typing import Any
 
 import yaml
 
+# Pre-formatted sequential IDs ("msg_001" ...) for the common brief sizes
+_MSG_IDS = tuple(f"msg_{i:03d}" for i in range(1, 1001))
+
+
+def _message_id(index: int) -> str:
+    """Return the auto-generated ID for the message at a 0-based index."""
+    if index < len(_MSG_IDS):
+        return _MSG_IDS[index]
+    return f"msg_{index + 1:03d}"
+
 
 def normalize_key_messages(messages: list[Any]) -> list[dict[str, str]]:
     """Normalize key messages to {id, text} objects.
@@ -28,23 +38,12 @@ def normalize_key_messages(messages: list[Any]) -> list[dict[str, str]]:
     normalized = []
     for i, msg in enumerate(messages):
         if isinstance(msg, str):
-            normalized.append(
-                {
-                    "id": f"msg_{i + 1:03d}",
-                    "text": msg.strip(),
-                }
-            )
+            msg_id, text = None, msg.strip()
         elif isinstance(msg, dict):
-            text = msg.get("text", "")
-            if msg.get("id"):
-                normalized.append({"id": msg["id"], "text": text})
-            else:
-                normalized.append(
-                    {
-                        "id": f"msg_{i + 1:03d}",
-                        "text": text,
-                    }
-                )
+            msg_id, text = msg.get("id"), msg.get("text", "")
+        else:
+            continue
+        normalized.append({"id": msg_id or _message_id(i), "text": text})
     return normalized
 
 
@@ -132,31 +131,34 @@ def parse_yaml_brief(content: str) -> dict[str, Any]:
     return result
 
 
-def parse_brief(brief_path: Path) -> dict[str, Any]:
-    """Parse a brief file (Markdown or YAML).
+def parse_brief_from_string(
+    content: str,
+    brief_format: str,
+    name: str,
+    source_file: str | None = None,
+) -> dict[str, Any]:
+    """Parse brief content that is already in memory.
 
     Args:
-        brief_path: Path to brief file
+        content: Brief text
+        brief_format: "yaml"/"yml" for YAML briefs, anything else is Markdown
+        name: Fallback brief name when the content doesn't provide one
+        source_file: Optional source path recorded on the result
 
     Returns:
         Structured brief dict
 
     Raises:
-        FileNotFoundError: If brief file doesn't exist
         ValueError: If brief has no key messages
     """
-    if not brief_path.exists():
-        raise FileNotFoundError(f"Brief file not found: {brief_path}")
-
-    content = brief_path.read_text(encoding="utf-8")
-
-    if brief_path.suffix.lower() in (".yaml", ".yml"):
+    if brief_format.lower().lstrip(".") in ("yaml", "yml"):
         result = parse_yaml_brief(content)
     else:
         result = parse_markdown_brief(content)
 
-    result["source_file"] = str(brief_path)
-    result["name"] = result.get("name", brief_path.stem)
+    if source_file is not None:
+        result["source_file"] = source_file
+    result["name"] = result.get("name", name)
 
     if result.get("key_messages"):
         result["key_messages"] = normalize_key_messages(result["key_messages"])
@@ -167,6 +169,32 @@ def parse_brief(brief_path: Path) -> dict[str, Any]:
     return result
 
 
+def parse_brief(brief_path: Path) -> dict[str, Any]:
+    """Parse a brief file (Markdown or YAML).
+
+    Args:
+        brief_path: Path to brief file
+
+    Returns:
+        Structured brief dict
+
+    Raises:
+        FileNotFoundError: If brief file doesn't exist
+        ValueError: If brief has no key messages
+    """
+    if not brief_path.exists():
+        raise FileNotFoundError(f"Brief file not found: {brief_path}")
+
+    content = brief_path.read_text(encoding="utf-8")
+
+    return parse_brief_from_string(
+        content,
+        brief_path.suffix,
+        brief_path.stem,
+        source_file=str(brief_path),
+    )
+
+
 def save_brief(brief: dict[str, Any], output_path: Path) -> None:
     """Save parsed brief to JSON.
 
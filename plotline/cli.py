@@ -351,6 +351,9 @@ def remove_interview(
 @app.command("extract")
 def extract_audio_cmd(
     force: bool = typer.Option(False, "--force", "-f", help="Re-extract already processed files"),
+    workers: int = typer.Option(
+        1, "--workers", "-j", min=1, help="Number of interviews to extract concurrently"
+    ),
 ) -> None:
     """Extract audio from video files."""
     project_dir = find_project_dir()
@@ -401,6 +404,7 @@ def extract_audio_cmd(
         manifest=manifest,
         force=force,
         console=console,
+        max_workers=workers,
     )
 
     project.save_manifest(manifest)
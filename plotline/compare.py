@@ -10,7 +10,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from plotline.analyze.scoring import compute_composite_score, normalize_metrics
+from plotline.analyze.scoring import compute_composite_score, normalize_metrics, sum_weights
 from plotline.project import read_json
 from plotline.utils import get_delivery_class
 
@@ -85,11 +85,12 @@ def normalize_scores_cross_interview(
         raw_metrics.append(raw)
 
     normalized = normalize_metrics(raw_metrics)
+    total_weight = sum_weights(weights)
 
     cross_scores = {}
     for i, seg in enumerate(all_segments):
         if i < len(normalized):
-            score = compute_composite_score(normalized[i], weights)
+            score = compute_composite_score(normalized[i], weights, total_weight)
             seg_id = seg.get("segment_id", "")
             cross_scores[seg_id] = score
 
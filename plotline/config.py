@@ -8,13 +8,20 @@ defaults, and validating all parameters.
 from __future__ import annotations
 
 import copy
+import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
+_PRIVACY_MODES = frozenset({"local", "hybrid"})
+_LLM_BACKENDS = frozenset({"ollama", "lmstudio", "claude", "openai"})
+_WHISPER_BACKENDS = frozenset({"mlx", "cpp", "faster"})
+_PROFILES = frozenset({"documentary", "brand", "commercial-doc"})
+
 
 class DeliveryWeights(BaseModel):
     """Weights for composite delivery score calculation."""
@@ -26,20 +33,6 @@ class DeliveryWeights(BaseModel):
     spectral_brightness: float = Field(default=0.10, ge=0.0, le=1.0)
     voice_texture: float = Field(default=0.05, ge=0.0, le=1.0)
 
-    @field_validator(
-        "energy",
-        "pitch_variation",
-        "speech_rate",
-        "pause_weight",
-        "spectral_brightness",
-        "voice_texture",
-    )
-    @classmethod
-    def validate_weight(cls, v: float) -> float:
-        if not 0.0 <= v <= 1.0:
-            raise ValueError("Weight must be between 0.0 and 1.0")
-        return v
-
 
 class PlotlineConfig(BaseModel):
     """Resolved configuration for a Plotline project."""
@@ -77,33 +70,29 @@ class PlotlineConfig(BaseModel):
     @field_validator("privacy_mode")
     @classmethod
     def validate_privacy_mode(cls, v: str) -> str:
-        valid = {"local", "hybrid"}
-        if v not in valid:
-            raise ValueError(f"privacy_mode must be one of: {valid}")
+        if v not in _PRIVACY_MODES:
+            raise ValueError(f"privacy_mode must be one of: {sorted(_PRIVACY_MODES)}")
         return v
 
     @field_validator("llm_backend")
     @classmethod
     def validate_llm_backend(cls, v: str) -> str:
-        valid = {"ollama", "lmstudio", "claude", "openai"}
-        if v not in valid:
-            raise ValueError(f"llm_backend must be one of: {valid}")
+        if v not in _LLM_BACKENDS:
+            raise ValueError(f"llm_backend must be one of: {sorted(_LLM_BACKENDS)}")
         return v
 
     @field_validator("whisper_backend")
     @classmethod
     def validate_whisper_backend(cls, v: str) -> str:
-        valid = {"mlx", "cpp", "faster"}
-        if v not in valid:
-            raise ValueError(f"whisper_backend must be one of: {valid}")
+        if v not in _WHISPER_BACKENDS:
+            raise ValueError(f"whisper_backend must be one of: {sorted(_WHISPER_BACKENDS)}")
         return v
 
     @field_validator("project_profile")
     @classmethod
     def validate_profile(cls, v: str) -> str:
-        valid = {"documentary", "brand", "commercial-doc"}
-        if v not in valid:
-            raise ValueError(f"profile must be one of: {valid}")
+        if v not in _PROFILES:
+            raise ValueError(f"profile must be one of: {sorted(_PROFILES)}")
         return v
 
 
@@ -150,15 +139,65 @@ BUILTIN_PROFILES: dict[str, dict[str, Any]] = {
 }
 
 
-def load_profile(name: str, profiles_dir: Path | None = None) -> dict[str, Any]:
-    """Load a profile by name, checking custom profiles first."""
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_YAML_CACHE_MAX_ENTRIES = 100
+
+# Parsed YAML keyed by absolute path, validated against (mtime_ns, size)
+_yaml_cache: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+
+
+def _load_yaml_cached(path: Path, *, copy_result: bool = True) -> Any:
+    """Parse a YAML file, reusing the previous parse if the file is unchanged.
+
+    Returns a deep copy so callers can mutate the result freely. Callers
+    that only read the data can pass copy_result=False to get the cached
+    object itself.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _yaml_cache.move_to_end(key)
+        return copy.deepcopy(cached[2]) if copy_result else cached[2]
+
+    with open(key, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+
+    _yaml_cache[key] = (st.st_mtime_ns, st.st_size, data)
+    _yaml_cache.move_to_end(key)
+    if len(_yaml_cache) > _YAML_CACHE_MAX_ENTRIES:
+        _yaml_cache.popitem(last=False)
+    return copy.deepcopy(data) if copy_result else data
+
+
+def clear_config_cache() -> None:
+    """Drop all cached YAML parses."""
+    _yaml_cache.clear()
+
+
+def load_profile(
+    name: str,
+    profiles_dir: Path | None = None,
+    *,
+    copy_result: bool = True,
+) -> dict[str, Any]:
+    """Load a profile by name, checking custom profiles first.
+
+    Custom profile files share the mtime-validated parse cache with
+    plotline.yaml, so repeat loads skip YAML parsing. With
+    copy_result=False the shared profile dict is returned and must not
+    be mutated.
+    """
     if profiles_dir and profiles_dir.exists():
         profile_file = profiles_dir / f"{name}.yaml"
         if profile_file.exists():
-            with open(profile_file, encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return _load_yaml_cached(profile_file, copy_result=copy_result)
     if name in BUILTIN_PROFILES:
-        return copy.deepcopy(BUILTIN_PROFILES[name])
+        profile = BUILTIN_PROFILES[name]
+        return copy.deepcopy(profile) if copy_result else profile
     raise ValueError(f"Unknown profile: {name}")
 
 
@@ -166,10 +205,13 @@ def merge_config(project_config: dict[str, Any], profile: dict[str, Any]) -> dic
     """Merge project config with profile defaults. Project config takes precedence."""
     merged = profile.copy()
     for key, value in project_config.items():
+        if value is None:
+            continue
         if key == "delivery_weights" and isinstance(value, dict):
-            merged.setdefault("delivery_weights", {})
-            merged["delivery_weights"].update(value)
-        elif value is not None:
+            base = merged.get(key)
+            # Build a fresh dict so the profile's nested weights are never mutated
+            merged[key] = {**base, **value} if isinstance(base, dict) else dict(value)
+        else:
             merged[key] = value
     return merged
 
@@ -180,15 +222,18 @@ def load_config(project_dir: Path) -> PlotlineConfig:
     if not config_file.exists():
         raise FileNotFoundError(f"No plotline.yaml found in {project_dir}")
 
-    with open(config_file, encoding="utf-8") as f:
-        raw_config = yaml.safe_load(f) or {}
+    # merge_config never mutates its inputs, so the cached/builtin dicts can
+    # be read in place; the merged result is a new dict owned by this call.
+    raw_config = _load_yaml_cached(config_file, copy_result=False) or {}
 
     profile_name = raw_config.get("project_profile", "documentary")
-    profiles_dir = project_dir / "profiles"
-    profile = load_profile(profile_name, profiles_dir if profiles_dir.exists() else None)
+    profiles_dir: Path | None = project_dir / "profiles"
+    if not profiles_dir.exists():
+        profiles_dir = None
+    profile = load_profile(profile_name, profiles_dir, copy_result=False)
 
     if "inherits" in profile:
-        parent = load_profile(profile["inherits"], profiles_dir if profiles_dir.exists() else None)
+        parent = load_profile(profile["inherits"], profiles_dir, copy_result=False)
         profile = merge_config(profile, parent)
 
     merged = merge_config(raw_config, profile)
@@ -217,4 +262,4 @@ def write_config(config: dict[str, Any], path: Path) -> None:
     """Write configuration to a YAML file."""
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(config, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
@@ -9,11 +9,15 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from plotline.diarize.speakers import SpeakerConfig
 
+# Shared read-only stand-in for a segment with no delivery analysis
+_NO_DELIVERY: MappingProxyType[str, Any] = MappingProxyType({})
+
 
 def merge_transcript_and_delivery(
     transcript: dict[str, Any],
@@ -55,7 +59,7 @@ def merge_transcript_and_delivery(
                 filtered_by_speaker[speaker] = filtered_by_speaker.get(speaker, 0) + 1
                 continue
 
-        dseg = delivery_segments.get(segment_id, {})
+        dseg = delivery_segments.get(segment_id, _NO_DELIVERY)
 
         enriched = {
             "segment_id": segment_id,
@@ -68,11 +72,12 @@ def merge_transcript_and_delivery(
             "speaker": speaker,
         }
 
-        delivery_data = dseg.get("normalized", {})
-        delivery_data["composite_score"] = dseg.get("composite_score", 0)
-        delivery_data["delivery_label"] = dseg.get("delivery_label", "")
-        delivery_data["raw"] = dseg.get("raw", {})
-        enriched["delivery"] = delivery_data
+        enriched["delivery"] = {
+            **dseg.get("normalized", _NO_DELIVERY),
+            "composite_score": dseg.get("composite_score", 0),
+            "delivery_label": dseg.get("delivery_label", ""),
+            "raw": dseg.get("raw", {}),
+        }
 
         enriched_segments.append(enriched)
 
@@ -11,7 +11,12 @@ import re
 from pathlib import Path
 from typing import Any
 
-from plotline.export.timecode import is_drop_frame_fps, seconds_to_timecode
+from plotline.export.timecode import (
+    frames_to_timecode,
+    is_drop_frame_fps,
+    seconds_to_timecode,
+    timecode_to_seconds,
+)
 
 
 def _make_reel_name(filename: str, used: set[str], counter: int) -> str:
@@ -121,7 +126,9 @@ def generate_edl(
             lines.append(f"* {reel_name} = {filename}")
         lines.append("")
 
-    rec_frame_counter = 3600 * fps
+    # Record track starts at 01:00:00:00; each event's OUT is the next event's IN
+    rec_frame_counter = round(3600 * fps)
+    rec_in_tc = frames_to_timecode(rec_frame_counter, fps, drop_frame)
 
     for i, sel in enumerate(selections, 1):
         interview_id = sel.get("interview_id", "")
@@ -157,8 +164,6 @@ def generate_edl(
 
         source_tc_offset = interview.get("start_timecode")
         if source_tc_offset:
-            from plotline.export.timecode import timecode_to_seconds
-
             offset_seconds = timecode_to_seconds(source_tc_offset, interview_fps)
         else:
             offset_seconds = 0
@@ -169,11 +174,8 @@ def generate_edl(
         src_in_tc = seconds_to_timecode(absolute_start, interview_fps, interview_drop)
         src_out_tc = seconds_to_timecode(absolute_end, interview_fps, interview_drop)
 
-        clip_duration_frames = round((padded_end - padded_start) * fps)
-        rec_in_tc = seconds_to_timecode(rec_frame_counter / fps, fps, drop_frame)
-        rec_out_frame = rec_frame_counter + clip_duration_frames
-        rec_out_tc = seconds_to_timecode(rec_out_frame / fps, fps, drop_frame)
-        rec_frame_counter = rec_out_frame
+        rec_frame_counter += round((padded_end - padded_start) * fps)
+        rec_out_tc = frames_to_timecode(rec_frame_counter, fps, drop_frame)
 
         event_line = (
             f"{i:03d}  {reel:<8s} V     C    {src_in_tc} {src_out_tc} {rec_in_tc} {rec_out_tc}"
@@ -215,6 +217,7 @@ def generate_edl(
                 lines.append(f"* COMMENT: {comment}")
 
         lines.append("")
+        rec_in_tc = rec_out_tc
 
     return "\n".join(lines)
 
@@ -7,10 +7,15 @@ with markers, keywords, and metadata.
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from xml.sax.saxutils import escape as xml_escape
 
+from plotline.export.timecode import is_drop_frame_fps
+
 
 def _xa(value: str) -> str:
     """Escape a string for safe use in an XML attribute value (double-quoted).
@@ -21,6 +26,30 @@ def _xa(value: str) -> str:
     return xml_escape(str(value), entities={'"': "&quot;"})
 
 
+# Standard frame rates -> FCPXML frame duration as (numerator, denominator)
+_FRAME_DURATIONS: dict[float, tuple[int, int]] = {
+    23.976: (1001, 24000),
+    29.97: (1001, 30000),
+    24: (100, 2400),
+    25: (100, 2500),
+}
+
+
+def _frame_duration(fps: float) -> tuple[int, int]:
+    """Return the rational frame duration for a frame rate.
+
+    Exact matches hit the table directly; near matches (e.g. 23.98) fall
+    back to a tolerance scan, and anything else uses ``100/(fps*100)``.
+    """
+    duration = _FRAME_DURATIONS.get(fps)
+    if duration is not None:
+        return duration
+    for rate, duration in _FRAME_DURATIONS.items():
+        if abs(fps - rate) < 0.01:
+            return duration
+    return 100, int(fps * 100)
+
+
 def seconds_to_fcpxml_time(seconds: float, fps: float) -> str:
     """Convert seconds to FCPXML rational time.
 
@@ -31,73 +60,72 @@ def seconds_to_fcpxml_time(seconds: float, fps: float) -> str:
     Returns:
         Time string like "2340/1000s"
     """
-    frame_count = round(seconds * fps)
+    numerator, denominator = _frame_duration(fps)
+    return f"{round(seconds * fps) * numerator}/{denominator}s"
 
-    if abs(fps - 23.976) < 0.01:
-        numerator = frame_count * 1001
-        denominator = 24000
-    elif abs(fps - 29.97) < 0.01:
-        numerator = frame_count * 1001
-        denominator = 30000
-    elif abs(fps - 24) < 0.01:
-        numerator = frame_count * 100
-        denominator = 2400
-    elif abs(fps - 25) < 0.01:
-        numerator = frame_count * 100
-        denominator = 2500
-    else:
-        numerator = frame_count * 100
-        denominator = int(fps * 100)
-
-    return f"{numerator}/{denominator}s"
 
-
-def get_fcpxml_format(fps: float, width: int = 1920, height: int = 1080) -> dict[str, str]:
+@functools.lru_cache(maxsize=16)
+def get_fcpxml_format(fps: float, width: int = 1920, height: int = 1080) -> Mapping[str, str]:
     """Get FCPXML format attributes for a given frame rate.
 
+    Results are cached per (fps, width, height), so the returned mapping
+    is read-only; copy it with ``dict()`` before modifying.
+
     Args:
         fps: Frames per second
         width: Video width
         height: Video height
 
     Returns:
-        Dict of format attributes
+        Read-only mapping of format attributes
     """
     if abs(fps - 23.976) < 0.01:
-        frame_duration = "1001/24000s"
         name = f"FFVideoFormat{height}p2398"
     elif abs(fps - 29.97) < 0.01:
-        frame_duration = "1001/30000s"
         name = f"FFVideoFormat{height}p2997"
     elif abs(fps - 24) < 0.01:
-        frame_duration = "100/2400s"
         name = f"FFVideoFormat{height}p24"
     elif abs(fps - 25) < 0.01:
-        frame_duration = "100/2500s"
         name = f"FFVideoFormat{height}p25"
     else:
-        frame_duration = f"100/{int(fps * 100)}s"
         name = f"FFVideoFormat{height}p{int(fps)}"
 
-    return {
-        "id": "r1",
-        "name": name,
-        "frameDuration": frame_duration,
-        "width": str(width),
-        "height": str(height),
-    }
+    numerator, denominator = _frame_duration(fps)
+    frame_duration = f"{numerator}/{denominator}s"
+
+    return MappingProxyType(
+        {
+            "id": "r1",
+            "name": name,
+            "frameDuration": frame_duration,
+            "width": str(width),
+            "height": str(height),
+        }
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _absolute_path_to_file_url(path: str) -> str:
+    """Resolve an absolute path string and return its file:// URL (cached)."""
+    return Path(path).resolve().as_uri()
 
 
 def path_to_file_url(path: Path) -> str:
     """Convert filesystem path to file:// URL.
 
+    Results are cached per absolute path, so symlinks are resolved once
+    per process.
+
     Args:
         path: Filesystem path
 
     Returns:
         file:// URL string (cross-platform, handles Windows drive letters)
     """
-    return path.resolve().as_uri()
+    if not path.is_absolute():
+        # Relative paths depend on the working directory; anchor them first
+        path = Path.cwd() / path
+    return _absolute_path_to_file_url(str(path))
 
 
 def generate_fcpxml(
@@ -137,11 +165,8 @@ def generate_fcpxml(
     ]
 
     format_attrs = get_fcpxml_format(fps)
-    format_line = "        <format"
-    for key, value in format_attrs.items():
-        format_line += f' {key}="{value}"'
-    format_line += "/>"
-    lines.append(format_line)
+    format_attr_str = " ".join(f'{key}="{value}"' for key, value in format_attrs.items())
+    lines.append(f"        <format {format_attr_str}/>")
 
     asset_id = 1
     asset_map = {}
@@ -164,6 +189,8 @@ def generate_fcpxml(
 
     # Pre-compute clip data to determine actual total duration with handles
     clip_data = []
+    chapter_markers = []
+    prev_role = None
     cumulative_offset = 0.0
 
     for i, sel in enumerate(selections, 1):
@@ -224,11 +251,15 @@ def generate_fcpxml(
             }
         )
 
+        if role and role != prev_role:
+            chapter_markers.append({"offset": cumulative_offset, "role": role})
+            prev_role = role
+
         cumulative_offset += clip_duration
 
     total_duration_tc = seconds_to_fcpxml_time(cumulative_offset, fps)
 
-    tc_format = "DF" if abs(fps - 29.97) < 0.01 else "NDF"
+    tc_format = "DF" if is_drop_frame_fps(fps) else "NDF"
 
     lines.extend(
         [
@@ -245,14 +276,14 @@ def generate_fcpxml(
     for clip in clip_data:
         sel = clip["sel"]
         ref = asset_map.get(clip["interview_id"], "a1")
-        clip_duration = clip["clip_duration"]
+        duration_tc = seconds_to_fcpxml_time(clip["clip_duration"], fps)
 
         clip_line = (
             f'                        <clip name="{_xa(clip["clip_name"])}" '
             f'ref="{ref}" '
             f'offset="{seconds_to_fcpxml_time(clip["offset"], fps)}" '
             f'start="{seconds_to_fcpxml_time(clip["padded_start"], fps)}" '
-            f'duration="{seconds_to_fcpxml_time(clip_duration, fps)}">'
+            f'duration="{duration_tc}">'
         )
         lines.append(clip_line)
 
@@ -260,7 +291,7 @@ def generate_fcpxml(
         if speaker:
             lines.append(
                 f'                            <keyword start="0s" '
-                f'duration="{seconds_to_fcpxml_time(clip_duration, fps)}" '
+                f'duration="{duration_tc}" '
                 f'value="{_xa(f"Speaker: {speaker}")}"/>'
             )
 
@@ -269,7 +300,7 @@ def generate_fcpxml(
             theme_str = ", ".join(str(t) for t in themes)
             lines.append(
                 f'                            <keyword start="0s" '
-                f'duration="{seconds_to_fcpxml_time(clip_duration, fps)}" '
+                f'duration="{duration_tc}" '
                 f'value="{_xa(theme_str)}"/>'
             )
 
@@ -291,24 +322,7 @@ def generate_fcpxml(
 
         lines.append("                        </clip>")
 
-    chapter_markers = []
-    prev_role = None
-    for clip in clip_data:
-        role = clip.get("role", "")
-        if role and role != prev_role:
-            chapter_markers.append(
-                {
-                    "offset": clip["offset"],
-                    "role": role,
-                }
-            )
-            prev_role = role
-
-    lines.extend(
-        [
-            "                    </spine>",
-        ]
-    )
+    lines.append("                    </spine>")
 
     for marker in chapter_markers:
         role_title = marker["role"].replace("_", " ").title()
@@ -7,20 +7,62 @@ and non-drop-frame formats for various frame rates.
 
 from __future__ import annotations
 
+import functools
 
-def seconds_to_ndf_timecode(seconds: float, fps: float) -> str:
-    """Convert float seconds to non-drop-frame timecode.
+# Drop-frame nominal rates (30 for 29.97, 60 for 59.94) -> frame numbers
+# skipped at each minute mark that isn't a multiple of 10
+_DF_DROPS_PER_MINUTE = {30: 2, 60: 4}
+
+# Drop-frame rates as round(fps * 1000), so 29.97 and 30000/1001 both match
+_DROP_FRAME_KEYS = frozenset({29970, 59940})
+
+
+def _build_df_offset_table(nominal_fps: int) -> tuple[int, ...]:
+    """Build the cumulative actual-frame offset of each minute in a day.
+
+    Entry ``m`` is the real frame count at display time ``mm:00;00`` of
+    minute ``m`` (0-1439), i.e. ``m * 60 * nominal_fps`` minus every frame
+    number dropped before that minute.
+    """
+    drops = _DF_DROPS_PER_MINUTE[nominal_fps]
+    frames_per_minute = nominal_fps * 60
+    return tuple(m * frames_per_minute - drops * (m - m // 10) for m in range(1440))
+
+
+_DF_OFFSET_TABLES: dict[int, tuple[int, ...]] = {
+    nominal: _build_df_offset_table(nominal) for nominal in _DF_DROPS_PER_MINUTE
+}
+
+# Actual frames in 24 hours of drop-frame timecode, per nominal rate
+_DF_FRAMES_PER_DAY = {
+    nominal: 1440 * nominal * 60 - drops * (1440 - 144)
+    for nominal, drops in _DF_DROPS_PER_MINUTE.items()
+}
+
+
+def _df_timecode_to_frames(timecode: str, nominal_fps: int) -> int:
+    """Convert drop-frame timecode to an exact frame count via the offset table.
 
     Args:
-        seconds: Time in seconds
-        fps: Frames per second (23.976, 24, 25, 30, etc.)
+        timecode: Timecode string in HH:MM:SS;FF format
+        nominal_fps: Nominal integer rate (30 for 29.97, 60 for 59.94)
 
     Returns:
-        Timecode string in HH:MM:SS:FF format
+        Frame count
     """
-    total_frames = round(seconds * fps)
-    frames_per_second = round(fps)
+    parts = timecode.replace(":", ";").split(";")
+    hh, mm, ss, ff = int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3])
+
+    days, minute = divmod(hh * 60 + mm, 1440)
+    offset = _DF_OFFSET_TABLES[nominal_fps][minute]
+    if days:
+        offset += days * _DF_FRAMES_PER_DAY[nominal_fps]
+
+    return offset + ss * nominal_fps + ff
 
+
+def _ndf_frames_to_timecode(total_frames: int, frames_per_second: int) -> str:
+    """Format a frame count as non-drop-frame timecode (HH:MM:SS:FF)."""
     ff = total_frames % frames_per_second
     total_seconds = total_frames // frames_per_second
     ss = total_seconds % 60
@@ -30,38 +72,65 @@ def seconds_to_ndf_timecode(seconds: float, fps: float) -> str:
     return f"{hh:02d}:{mm:02d}:{ss:02d}:{ff:02d}"
 
 
-def seconds_to_df_timecode(seconds: float) -> str:
-    """Convert float seconds to 29.97 drop-frame timecode.
+def _df_frames_to_timecode(frame_count: int, nominal_fps: int) -> str:
+    """Format a frame count as drop-frame timecode (HH:MM:SS;FF).
+
+    Pure integer math: add back the frame numbers skipped before
+    ``frame_count`` (per full 10-minute block, then per minute within the
+    block) to get the display frame number, then split it at the nominal rate.
+    """
+    drops = _DF_DROPS_PER_MINUTE[nominal_fps]
+    frames_per_minute = nominal_fps * 60 - drops
+    frames_per_10_minutes = nominal_fps * 600 - 9 * drops
+
+    d = frame_count // frames_per_10_minutes
+    m = frame_count % frames_per_10_minutes
+
+    if m < drops:
+        adjustment = 0
+    else:
+        adjustment = drops * ((m - drops) // frames_per_minute)
+
+    adjusted_frames = frame_count + 9 * drops * d + adjustment
+
+    ff = adjusted_frames % nominal_fps
+    ss = (adjusted_frames // nominal_fps) % 60
+    mm = (adjusted_frames // (nominal_fps * 60)) % 60
+    hh = adjusted_frames // (nominal_fps * 3600)
 
-    Drop-frame skips frame numbers :00 and :01 at every minute mark
-    except every 10th minute (00, 10, 20, 30, 40, 50).
+    return f"{hh:02d}:{mm:02d}:{ss:02d};{ff:02d}"
 
-    Uses the exact NTSC rate 30000/1001 for frame counting.
+
+def seconds_to_ndf_timecode(seconds: float, fps: float) -> str:
+    """Convert float seconds to non-drop-frame timecode.
 
     Args:
         seconds: Time in seconds
+        fps: Frames per second (23.976, 24, 25, 30, etc.)
 
     Returns:
-        Timecode string in HH:MM:SS;FF format (semicolon indicates drop-frame)
+        Timecode string in HH:MM:SS:FF format
     """
-    frame_count = round(seconds * 30000 / 1001)
+    return _ndf_frames_to_timecode(round(seconds * fps), round(fps))
 
-    d = frame_count // 17982
-    m = frame_count % 17982
 
-    if m < 2:
-        adjustment = 0
-    else:
-        adjustment = 2 * ((m - 2) // 1798)
+def seconds_to_df_timecode(seconds: float, fps: float = 29.97) -> str:
+    """Convert float seconds to drop-frame timecode (29.97 or 59.94).
 
-    adjusted_frames = frame_count + 18 * d + adjustment
+    Drop-frame skips frame numbers :00 and :01 (:00-:03 at 59.94) at every
+    minute mark except every 10th minute (00, 10, 20, 30, 40, 50).
 
-    ff = adjusted_frames % 30
-    ss = (adjusted_frames // 30) % 60
-    mm = (adjusted_frames // 1800) % 60
-    hh = adjusted_frames // 108000
+    Uses the exact NTSC rate (nominal * 1000/1001) for frame counting.
 
-    return f"{hh:02d}:{mm:02d}:{ss:02d};{ff:02d}"
+    Args:
+        seconds: Time in seconds
+        fps: Drop-frame rate, 29.97 (default) or 59.94
+
+    Returns:
+        Timecode string in HH:MM:SS;FF format (semicolon indicates drop-frame)
+    """
+    nominal = round(fps)
+    return _df_frames_to_timecode(round(seconds * nominal * 1000 / 1001), nominal)
 
 
 def seconds_to_timecode(seconds: float, fps: float, drop_frame: bool = False) -> str:
@@ -70,13 +139,13 @@ def seconds_to_timecode(seconds: float, fps: float, drop_frame: bool = False) ->
     Args:
         seconds: Time in seconds
         fps: Frames per second
-        drop_frame: Whether to use drop-frame (for 29.97fps)
+        drop_frame: Whether to use drop-frame (for 29.97/59.94fps)
 
     Returns:
         Timecode string
     """
-    if drop_frame and abs(fps - 29.97) < 0.01:
-        return seconds_to_df_timecode(seconds)
+    if drop_frame and is_drop_frame_fps(fps):
+        return seconds_to_df_timecode(seconds, fps)
     return seconds_to_ndf_timecode(seconds, fps)
 
 
@@ -97,42 +166,35 @@ def ndf_timecode_to_seconds(timecode: str, fps: float) -> float:
     return total_frames / fps
 
 
-def df_timecode_to_seconds(timecode: str) -> float:
-    """Convert 29.97 drop-frame timecode to seconds.
+def df_timecode_to_seconds(timecode: str, fps: float = 29.97) -> float:
+    """Convert drop-frame timecode (29.97 or 59.94) to seconds.
 
-    Uses the SMPTE standard formula: compute the display frame number
-    as if counting at 30fps, then subtract the accumulated drop-frame
-    adjustments (2 frames per minute, except every 10th minute) across
-    all hours and minutes.
+    Uses the SMPTE standard formula: the display frame number as if
+    counting at 30fps, minus the accumulated drop-frame adjustments
+    (2 frames per minute, except every 10th minute), read from the
+    precomputed per-minute offset table.
 
     Args:
         timecode: Timecode string in HH:MM:SS;FF format
+        fps: Drop-frame rate, 29.97 (default) or 59.94
 
     Returns:
         Time in seconds
     """
-    parts = timecode.replace(":", ";").split(";")
-    hh, mm, ss, ff = int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3])
-
-    # Display frame number assuming 30fps NDF counting
-    display_frames = hh * 108000 + mm * 1800 + ss * 30 + ff
+    nominal = round(fps)
+    actual_frames = _df_timecode_to_frames(timecode, nominal)
 
-    # Total minutes across all hours
-    total_minutes = hh * 60 + mm
-
-    # Accumulated drop-frame adjustments: 2 per minute, except every 10th minute
-    drops = 2 * (total_minutes - total_minutes // 10)
-
-    # Actual frame count = display number minus dropped frame numbers
-    actual_frames = display_frames - drops
-
-    # Convert to seconds using exact NTSC rate (30000/1001)
-    return actual_frames * 1001 / 30000
+    # Convert to seconds using exact NTSC rate (nominal * 1000/1001)
+    return actual_frames * 1001 / (nominal * 1000)
 
 
+@functools.lru_cache(maxsize=4096)
 def timecode_to_seconds(timecode: str, fps: float) -> float:
     """Convert timecode to seconds, auto-detecting drop-frame.
 
+    Results are cached; the same start timecodes are converted for every
+    selection of an interview during export.
+
     Args:
         timecode: Timecode string
         fps: Frames per second
@@ -143,7 +205,7 @@ def timecode_to_seconds(timecode: str, fps: float) -> float:
     is_drop_frame = ";" in timecode
 
     if is_drop_frame:
-        return df_timecode_to_seconds(timecode)
+        return df_timecode_to_seconds(timecode, fps if is_drop_frame_fps(fps) else 29.97)
     return ndf_timecode_to_seconds(timecode, fps)
 
 
@@ -156,12 +218,15 @@ def is_drop_frame_fps(fps: float) -> bool:
     Returns:
         True if drop-frame should be used
     """
-    return abs(fps - 29.97) < 0.01
+    return round(fps * 1000) in _DROP_FRAME_KEYS
 
 
 def frames_to_timecode(total_frames: int, fps: float, drop_frame: bool = False) -> str:
     """Convert frame count to timecode.
 
+    Works on the frame count directly in integers, without a round trip
+    through seconds.
+
     Args:
         total_frames: Total number of frames
         fps: Frames per second
@@ -170,13 +235,17 @@ def frames_to_timecode(total_frames: int, fps: float, drop_frame: bool = False)
     Returns:
         Timecode string
     """
-    seconds = total_frames / fps
-    return seconds_to_timecode(seconds, fps, drop_frame)
+    if drop_frame and is_drop_frame_fps(fps):
+        return _df_frames_to_timecode(total_frames, round(fps))
+    return _ndf_frames_to_timecode(total_frames, round(fps))
 
 
+@functools.lru_cache(maxsize=4096)
 def timecode_to_frames(timecode: str, fps: float) -> int:
     """Convert timecode to frame count.
 
+    Results are cached, like timecode_to_seconds.
+
     Args:
         timecode: Timecode string
         fps: Frames per second
@@ -184,5 +253,13 @@ def timecode_to_frames(timecode: str, fps: float) -> int:
     Returns:
         Frame count
     """
+    nominal_fps = round(fps)
+    if ";" in timecode and nominal_fps in _DF_OFFSET_TABLES:
+        return _df_timecode_to_frames(timecode, nominal_fps)
+    if ";" not in timecode:
+        parts = timecode.split(":")
+        hh, mm, ss, ff = int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3])
+        return (hh * 3600 + mm * 60 + ss) * nominal_fps + ff
+
     seconds = timecode_to_seconds(timecode, fps)
     return round(seconds * fps)
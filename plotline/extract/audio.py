@@ -9,9 +9,12 @@ Extracts audio from video files, producing two versions:
 from __future__ import annotations
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 def extract_audio(
     source_path: Path,
@@ -118,14 +121,21 @@ def extract_all_interviews(
     manifest: dict[str, Any],
     force: bool = False,
     console=None,
+    max_workers: int = 1,
 ) -> dict[str, Any]:
     """Extract audio for all interviews in a project.
 
+    Interviews are extracted one at a time by default. With max_workers
+    above 1 they run concurrently: each extraction runs in its own FFmpeg
+    processes, so a thread pool is enough to keep several going at once;
+    manifest updates happen on the calling thread.
+
     Args:
         project_path: Path to project directory
         manifest: Project manifest dict
         force: Re-extract even if already extracted
         console: Optional rich console for output
+        max_workers: Maximum concurrent extractions (default: 1)
 
     Returns:
         Dict with extraction summary
@@ -147,6 +157,10 @@ def extract_all_interviews(
     table.add_column("Full Rate", style="green")
     table.add_column("Status", style="yellow")
 
+    # Summary rows in manifest order; extraction rows are filled in afterwards
+    rows: list[tuple[str, str, str, str] | None] = []
+    jobs: list[tuple[int, dict[str, Any], Path, Path, Path]] = []
+
     for interview in manifest.get("interviews", []):
         interview_id = interview["id"]
         source_file = Path(interview["source_file"])
@@ -156,17 +170,19 @@ def extract_all_interviews(
         audio_full = interview_dir / "audio_full.wav"
 
         if interview["stages"].get("extracted") and not force:
-            table.add_row(
-                interview_id,
-                format_size(audio_16k) if audio_16k.exists() else "-",
-                format_size(audio_full) if audio_full.exists() else "-",
-                "[dim]Skipped (already extracted)[/dim]",
+            rows.append(
+                (
+                    interview_id,
+                    format_size(audio_16k),
+                    format_size(audio_full),
+                    "[dim]Skipped (already extracted)[/dim]",
+                )
             )
             results["skipped"] += 1
             continue
 
         if not source_file.exists():
-            table.add_row(interview_id, "-", "-", "[red]Source not found[/red]")
+            rows.append((interview_id, "-", "-", "[red]Source not found[/red]"))
             results["failed"] += 1
             results["errors"].append(
                 {
@@ -176,21 +192,39 @@ def extract_all_interviews(
             )
             continue
 
-        try:
-            interview_dir.mkdir(parents=True, exist_ok=True)
+        jobs.append((len(rows), interview, source_file, audio_16k, audio_full))
+        rows.append(None)
+
+    workers = max(1, min(max_workers, len(jobs)))
+    # Per-step progress lines are only meaningful when extracting one at a time
+    job_console = console if workers == 1 else None
+
+    def _run(job: tuple[int, dict[str, Any], Path, Path, Path]) -> None:
+        _, interview, source_file, audio_16k, audio_full = job
+        if console and job_console is None:
+            console.print(f"[dim]  Extracting {interview['id']}...[/dim]")
+        audio_16k.parent.mkdir(parents=True, exist_ok=True)
+        extract_audio(
+            source_path=source_file,
+            output_16k=audio_16k,
+            output_full=audio_full,
+            console=job_console,
+        )
 
-            extract_audio(
-                source_path=source_file,
-                output_16k=audio_16k,
-                output_full=audio_full,
-                console=console,
-            )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run, job) for job in jobs]
+
+    # Record outcomes in manifest order so errors and rows stay deterministic
+    for future, (row_index, interview, _, audio_16k, audio_full) in zip(futures, jobs):
+        interview_id = interview["id"]
+        try:
+            future.result()
 
             interview["audio_16k_path"] = audio_16k.relative_to(project_path).as_posix()
             interview["audio_full_path"] = audio_full.relative_to(project_path).as_posix()
             interview["stages"]["extracted"] = True
 
-            table.add_row(
+            rows[row_index] = (
                 interview_id,
                 format_size(audio_16k),
                 format_size(audio_full),
@@ -199,7 +233,7 @@ def extract_all_interviews(
             results["extracted"] += 1
 
         except Exception as e:
-            table.add_row(interview_id, "-", "-", f"[red]Error: {e}[/red]")
+            rows[row_index] = (interview_id, "-", "-", f"[red]Error: {e}[/red]")
             results["failed"] += 1
             results["errors"].append(
                 {
@@ -208,6 +242,10 @@ def extract_all_interviews(
                 }
             )
 
+    for row in rows:
+        if row is not None:
+            table.add_row(*row)
+
     if console:
         console.print(table)
 
@@ -216,11 +254,10 @@ def extract_all_interviews(
 
 def format_size(path: Path) -> str:
     """Format file size in human-readable format."""
-    if not path.exists():
+    try:
+        size = path.stat().st_size
+    except OSError:
         return "-"
-    size = path.stat().st_size
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} TB"
+    # Each unit step is 2**10, so the unit index comes straight from the bit length
+    exp = min(max(0, (size.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (exp * 10)):.1f} {_SIZE_UNITS[exp]}"
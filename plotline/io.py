@@ -7,14 +7,26 @@ Centralized I/O utilities for all pipeline stages.
 from __future__ import annotations
 
 import json
+import math
+import os
 import tempfile
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Stdlib encoders are configured once per indent and reused
+_STDLIB_ENCODERS: dict[int, json.JSONEncoder] = {}
+
 
 def read_json(path: Path) -> dict[str, Any]:
     """Read JSON file with UTF-8 encoding.
 
+    Uses orjson when it is installed, falling back to the stdlib parser.
+
     Args:
         path: Path to JSON file
 
@@ -25,36 +37,156 @@ def read_json(path: Path) -> dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file contains invalid JSON
     """
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return loads_json(_read_bytes(path))
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a whole file with one open and a read sized from fstat.
+
+    Args:
+        path: Path to file
+
+    Returns:
+        File contents
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # Short read (very large file) or a size fstat can't report: read to EOF
+        if not size or len(data) < size:
+            chunks = [data]
+            while chunk := os.read(fd, 65536):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def loads_json(text: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Uses orjson when it is installed, falling back to the stdlib parser
+    for input orjson rejects (NaN/Infinity, ints beyond 64 bits).
+
+    Args:
+        text: JSON text, as str or UTF-8 bytes
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    return json.loads(text)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Return True if data contains a NaN or infinite float at any depth."""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _encode_json(data: Any, indent: int) -> bytes:
+    """Serialize data to pretty-printed UTF-8 JSON bytes.
+
+    orjson handles the default indent of 2 when installed; anything it
+    can't encode (non-string keys, ints beyond 64 bits, NaN/Infinity)
+    or other indents go through the stdlib encoder, so the output doesn't
+    depend on whether orjson is installed.
+    """
+    if orjson is not None and indent == 2:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # orjson writes NaN/Infinity as null; only a null in the output
+            # can hide one, so the data is only scanned in that case
+            if b"null" not in payload or not _has_non_finite(data):
+                return payload
+
+    encoder = _STDLIB_ENCODERS.get(indent)
+    if encoder is None:
+        encoder = _STDLIB_ENCODERS[indent] = json.JSONEncoder(indent=indent, ensure_ascii=False)
+    return encoder.encode(data).encode("utf-8")
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Write bytes to path atomically.
+
+    The payload goes to a uniquely named sibling temp file which is
+    fsynced and then renamed over the destination, so readers only ever
+    see the old or the new contents, even with concurrent writers.
+
+    Args:
+        path: Destination path
+        payload: Bytes to write
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    tmp_path = Path(tmp_name)
+
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def dumps_json(data: Any, indent: int = 2) -> str:
+    """Serialize data to a pretty-printed JSON string.
+
+    Uses orjson when it is installed and the data is something it can
+    encode, otherwise the stdlib encoder. Non-ASCII text is kept as-is.
+
+    Args:
+        data: Data to serialize
+        indent: Indentation level (orjson is only used for the default of 2)
+
+    Returns:
+        JSON text
+    """
+    return _encode_json(data, indent).decode("utf-8")
 
 
 def write_json(path: Path, data: dict[str, Any], indent: int = 2) -> None:
     """Write JSON file atomically with pretty formatting.
 
     Writes to a temp file first, then renames to prevent corruption
-    on interruption.
+    on interruption. Serialization goes through orjson when it is
+    installed (see dumps_json).
 
     Args:
         path: Destination path for JSON file
         data: Data to write
         indent: Indentation level for pretty printing (default: 2)
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        encoding="utf-8",
-        dir=path.parent,
-        delete=False,
-        suffix=".tmp",
-    ) as tmp:
-        tmp_path = Path(tmp.name)
-        try:
-            json.dump(data, tmp, indent=indent, ensure_ascii=False)
-        except Exception:
-            tmp_path.unlink(missing_ok=True)
-            raise
-    tmp_path.replace(path)
+    _atomic_write_bytes(path, _encode_json(data, indent))
 
 
 def read_text(path: Path) -> str:
@@ -66,8 +198,11 @@ def read_text(path: Path) -> str:
     Returns:
         File contents as string
     """
-    with open(path, encoding="utf-8") as f:
-        return f.read()
+    text = _read_bytes(path).decode("utf-8")
+    # Match text-mode universal newlines
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def write_text(path: Path, content: str) -> None:
@@ -77,18 +212,4 @@ def write_text(path: Path, content: str) -> None:
         path: Destination path
         content: Text content to write
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        encoding="utf-8",
-        dir=path.parent,
-        delete=False,
-        suffix=".tmp",
-    ) as tmp:
-        tmp_path = Path(tmp.name)
-        try:
-            tmp.write(content)
-        except Exception:
-            tmp_path.unlink(missing_ok=True)
-            raise
-    tmp_path.replace(path)
+    _atomic_write_bytes(path, content.encode("utf-8"))
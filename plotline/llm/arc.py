@@ -6,10 +6,15 @@ Selects and orders segments into a coherent narrative structure.
 
 from __future__ import annotations
 
+import heapq
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+# Shared read-only stand-in for arc entries whose segment is unknown
+_EMPTY_MAP: MappingProxyType[str, Any] = MappingProxyType({})
+
 
 def build_narrative_arc(
     synthesis: dict[str, Any],
@@ -53,11 +58,13 @@ def build_narrative_arc(
     candidate_count = max(100, int((target_duration * 3) / avg_duration))
     candidate_count = min(candidate_count, len(all_segments))  # Don't exceed total
 
-    top_segments = sorted(
+    # Partial selection: same result as a full descending sort cut to
+    # candidate_count (ties keep transcript order), in O(N log K)
+    top_segments = heapq.nlargest(
+        candidate_count,
         all_segments,
-        key=lambda s: s.get("delivery", {}).get("composite_score", 0),
-        reverse=True,
-    )[:candidate_count]
+        key=lambda s: s.get("delivery", _EMPTY_MAP).get("composite_score", 0),
+    )
 
     transcript_str = template_manager.format_transcript_for_prompt(top_segments)
 
@@ -119,10 +126,7 @@ def create_selections_from_arc(
     Returns:
         Selections dict ready for export
     """
-    segments_by_id = {}
-    for seg in all_segments:
-        if "segment_id" in seg:
-            segments_by_id[seg["segment_id"]] = seg
+    segments_by_id = {seg["segment_id"]: seg for seg in all_segments if "segment_id" in seg}
 
     selections = []
     total_duration = 0
@@ -131,19 +135,20 @@ def create_selections_from_arc(
         segment_id = arc_item.get("segment_id")
         if not segment_id:
             continue
-        source_seg = segments_by_id.get(segment_id, {})
+        source_seg = segments_by_id.get(segment_id, _EMPTY_MAP)
 
-        duration = source_seg.get("end", 0) - source_seg.get("start", 0)
-        total_duration += duration
+        start = source_seg.get("start", 0)
+        end = source_seg.get("end", 0)
+        total_duration += end - start
 
-        delivery = source_seg.get("delivery", {})
-        raw_delivery = delivery.get("raw", {})
+        delivery = source_seg.get("delivery", _EMPTY_MAP)
+        raw_delivery = delivery.get("raw", _EMPTY_MAP)
         selection = {
             "segment_id": segment_id,
             "interview_id": arc_item.get("interview_id", source_seg.get("interview_id", "")),
             "position": arc_item.get("position", len(selections) + 1),
-            "start": source_seg.get("start", 0),
-            "end": source_seg.get("end", 0),
+            "start": start,
+            "end": end,
             "text": source_seg.get("text", ""),
             "speaker": source_seg.get("speaker"),
             "role": arc_item.get("role", ""),
@@ -7,9 +7,12 @@ with privacy mode enforcement and retry logic.
 
 from __future__ import annotations
 
+import threading
 import time
 from typing import Any
 
+_CLOUD_BACKENDS = frozenset({"claude", "openai"})
+
 
 class LLMClient:
     """LLM client wrapper with privacy mode enforcement and retry logic."""
@@ -29,8 +32,10 @@ class LLMClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._cloud_backends = {"claude", "openai"}
+        self._cloud_backends = _CLOUD_BACKENDS
+        self._privacy_checked: tuple[str, str] | None = None
         self._token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        self._usage_lock = threading.Lock()
 
     def _get_model_string(self) -> str:
         """Get the model string for litellm based on backend."""
@@ -45,7 +50,14 @@ class LLMClient:
         return self.model
 
     def _check_privacy(self) -> None:
-        """Check if cloud API is allowed in current privacy mode."""
+        """Check if cloud API is allowed in current privacy mode.
+
+        A passing (backend, privacy_mode) pair is remembered so repeated
+        completions skip the policy check until either attribute changes.
+        """
+        key = (self.backend, self.privacy_mode)
+        if key == self._privacy_checked:
+            return
         if self.privacy_mode == "local" and self.backend in self._cloud_backends:
             from plotline.exceptions import LLMPrivacyError
 
@@ -53,6 +65,7 @@ class LLMClient:
                 f"Cloud LLM backend '{self.backend}' not allowed in local privacy mode. "
                 f"Set privacy_mode: hybrid in plotline.yaml to enable cloud APIs."
             )
+        self._privacy_checked = key
 
     def complete(
         self,
@@ -110,9 +123,12 @@ class LLMClient:
 
                 usage = getattr(response, "usage", None)
                 if usage:
-                    self._token_usage["prompt_tokens"] += getattr(usage, "prompt_tokens", 0)
-                    self._token_usage["completion_tokens"] += getattr(usage, "completion_tokens", 0)
-                    self._token_usage["total_tokens"] += getattr(usage, "total_tokens", 0)
+                    # complete() may be called from several threads at once
+                    with self._usage_lock:
+                        token_usage = self._token_usage
+                        token_usage["prompt_tokens"] += getattr(usage, "prompt_tokens", 0)
+                        token_usage["completion_tokens"] += getattr(usage, "completion_tokens", 0)
+                        token_usage["total_tokens"] += getattr(usage, "total_tokens", 0)
 
                 choices = getattr(response, "choices", [])
                 if not choices:
@@ -164,7 +180,8 @@ class LLMClient:
 
     def get_token_usage(self) -> dict[str, int]:
         """Get cumulative token usage."""
-        return self._token_usage.copy()
+        with self._usage_lock:
+            return self._token_usage.copy()
 
     def reset_token_usage(self) -> None:
         """Reset token usage counters."""
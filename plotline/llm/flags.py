@@ -120,9 +120,13 @@ def run_flags(
             "flags": [],
         }
 
+    # Clear flags from any previous run and index segments in the same pass
+    segment_by_id: dict[str, dict[str, Any]] = {}
     for seg in segments:
         seg["flagged"] = False
         seg["flag_reason"] = None
+        if seg.get("segment_id"):
+            segment_by_id[seg["segment_id"]] = seg
 
     if console:
         console.print(f"[cyan]Flagging {len(segments)} segments for cultural sensitivity...[/cyan]")
@@ -136,7 +140,6 @@ def run_flags(
     )
 
     flags = flags_result.get("flags", [])
-    segment_by_id = {s["segment_id"]: s for s in segments if s.get("segment_id")}
 
     flagged_count = 0
     for flag in flags:
@@ -151,9 +154,10 @@ def run_flags(
                 )
             continue
 
+        if not segment["flagged"]:
+            flagged_count += 1
         segment["flagged"] = True
         segment["flag_reason"] = flag.get("reason", "Flagged for cultural review")
-        flagged_count += 1
 
     selections_data["flagged_at"] = datetime.now().isoformat(timespec="seconds")
     selections_data["flags_model"] = client.model
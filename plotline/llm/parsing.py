@@ -11,6 +11,16 @@ import re
 from typing import Any
 
 from plotline.exceptions import LLMResponseError
+from plotline.io import loads_json
+
+_JSON_FENCE_RE = re.compile(r"```json\s*")
+_FENCE_RE = re.compile(r"```\s*")
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+_UNESCAPED_NEWLINE_RE = re.compile(r'(?<!\\)\n(?=[^"]*"[^"]*$)')
+# Tokens that matter for brace matching: whole strings (an unterminated one
+# runs to the end), backslash escapes, and braces. Possessive quantifiers
+# keep the scan linear with no backtracking.
+_JSON_TOKEN_RE = re.compile(r'"(?:[^"\\]++|\\.)*+"?|\\.|[{}]', re.DOTALL)
 
 
 def extract_json_from_response(response: str) -> str:
@@ -29,8 +39,8 @@ def extract_json_from_response(response: str) -> str:
 
     # Remove markdown code blocks
     if "```" in text:
-        text = re.sub(r"```json\s*", "", text)
-        text = re.sub(r"```\s*", "", text)
+        text = _JSON_FENCE_RE.sub("", text)
+        text = _FENCE_RE.sub("", text)
         text = text.strip()
 
     # Find the start of the JSON object
@@ -41,32 +51,14 @@ def extract_json_from_response(response: str) -> str:
     # Try to find a complete JSON object with balanced braces
     # This handles cases where there's text after the JSON
     depth = 0
-    in_string = False
-    escape_next = False
-    end_idx = None
-
-    for i, char in enumerate(text[start_idx:], start_idx):
-        if escape_next:
-            escape_next = False
-            continue
-        if char == "\\":
-            escape_next = True
-            continue
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if char == "{":
+    for match in _JSON_TOKEN_RE.finditer(text, start_idx):
+        token = match.group()
+        if token == "{":
             depth += 1
-        elif char == "}":
+        elif token == "}":
             depth -= 1
             if depth == 0:
-                end_idx = i + 1
-                break
-
-    if end_idx:
-        return text[start_idx:end_idx]
+                return text[start_idx : match.end()]
 
     # No complete JSON found - return everything from { for repair attempts
     return text[start_idx:]
@@ -82,10 +74,10 @@ def repair_json(text: str) -> str:
         Repaired JSON string
     """
     # Remove trailing commas before } or ]
-    text = re.sub(r",(\s*[}\]])", r"\1", text)
+    text = _TRAILING_COMMA_RE.sub(r"\1", text)
 
     # Fix unescaped newlines in strings (basic attempt)
-    text = re.sub(r'(?<!\\)\n(?=[^"]*"[^"]*$)', "\\n", text)
+    text = _UNESCAPED_NEWLINE_RE.sub("\\n", text)
 
     # Fix missing closing braces - count open vs close
     open_braces = text.count("{")
@@ -120,18 +112,37 @@ def parse_llm_json(response: str) -> dict[str, Any]:
     Raises:
         LLMResponseError: If parsing fails
     """
+    # Fast path: well-behaved models return a bare JSON object, possibly
+    # wrapped in a single fenced block
+    stripped = response.strip()
+    if stripped.startswith("```") and stripped.endswith("```"):
+        stripped = stripped[3:-3].removeprefix("json").strip()
+    # Only attempt a parse when both ends look like an object; truncated
+    # responses go straight to extraction and repair
+    attempted = None
+    if stripped.startswith("{") and stripped.endswith("}"):
+        attempted = stripped
+        try:
+            data = loads_json(stripped)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(data, dict):
+                return data
+
     text = extract_json_from_response(response)
 
-    # First attempt: parse as-is
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
+    # First attempt: parse as-is, unless the fast path already tried this text
+    if text != attempted:
+        try:
+            return loads_json(text)
+        except json.JSONDecodeError:
+            pass
 
     # Second attempt: repair and retry
     repaired = repair_json(text)
     try:
-        return json.loads(repaired)
+        return loads_json(repaired)
     except json.JSONDecodeError:
         pass
 
@@ -149,7 +160,7 @@ def parse_llm_json(response: str) -> dict[str, Any]:
         truncated += "]" * max(0, open_brackets) + "}" * max(0, open_braces)
 
         try:
-            return json.loads(truncated)
+            return loads_json(truncated)
         except json.JSONDecodeError:
             pass
 
@@ -163,7 +174,7 @@ def parse_llm_json(response: str) -> dict[str, Any]:
         truncated += "]" * max(0, open_brackets) + "}" * max(0, open_braces)
 
         try:
-            return json.loads(truncated)
+            return loads_json(truncated)
         except json.JSONDecodeError:
             pass
 
@@ -217,7 +228,7 @@ def validate_themes_response(data: dict[str, Any], interview_id: str) -> dict[st
         ]
 
         normalized = {
-            "theme_id": theme.get("theme_id", f"theme_{i + 1:03d}"),
+            "theme_id": theme["theme_id"] if "theme_id" in theme else f"theme_{i + 1:03d}",
             "name": theme["name"],
             "description": theme.get("description", ""),
             "segment_ids": valid_segment_ids,
@@ -225,8 +236,9 @@ def validate_themes_response(data: dict[str, Any], interview_id: str) -> dict[st
             "strength": strength,
         }
 
-        if theme.get("brief_alignment"):
-            normalized["brief_alignment"] = theme["brief_alignment"]
+        brief_alignment = theme.get("brief_alignment")
+        if brief_alignment:
+            normalized["brief_alignment"] = brief_alignment
 
         themes.append(normalized)
 
@@ -240,15 +252,13 @@ def validate_themes_response(data: dict[str, Any], interview_id: str) -> dict[st
             continue
         seg_id = intersection.get("segment_id", "")
         if isinstance(seg_id, str) and seg_id.startswith(interview_id):
+            intersection_themes = intersection.get("themes")
+            note = intersection.get("note")
             intersections.append(
                 {
                     "segment_id": seg_id,
-                    "themes": intersection.get("themes", [])
-                    if isinstance(intersection.get("themes"), list)
-                    else [],
-                    "note": intersection.get("note", "")
-                    if isinstance(intersection.get("note"), str)
-                    else "",
+                    "themes": intersection_themes if isinstance(intersection_themes, list) else [],
+                    "note": note if isinstance(note, str) else "",
                 }
             )
 
@@ -297,7 +307,9 @@ def validate_synthesis_response(data: dict[str, Any]) -> dict[str, Any]:
     unified_themes = []
     for i, theme in enumerate(data["unified_themes"]):
         normalized = {
-            "unified_theme_id": theme.get("unified_theme_id", f"utheme_{i + 1:03d}"),
+            "unified_theme_id": (
+                theme["unified_theme_id"] if "unified_theme_id" in theme else f"utheme_{i + 1:03d}"
+            ),
             "name": theme.get("name", "Unnamed"),
             "description": theme.get("description", ""),
             "source_themes": theme.get("source_themes", []),
@@ -336,12 +348,13 @@ def validate_arc_response(
 
     arc = []
     for i, item in enumerate(data["arc"]):
-        if not item.get("segment_id"):
+        segment_id = item.get("segment_id")
+        if not segment_id:
             raise LLMResponseError(f"Arc item {i} missing 'segment_id'")
 
         normalized = {
             "position": item.get("position", i + 1),
-            "segment_id": item["segment_id"],
+            "segment_id": segment_id,
             "interview_id": item.get("interview_id", ""),
             "role": item.get("role", "unknown"),
             "themes": item.get("themes", []),
@@ -371,15 +384,25 @@ def validate_flags_response(data: dict[str, Any]) -> dict[str, Any]:
 
     Returns:
         Validated flags dict
+
+    Raises:
+        LLMResponseError: If 'flags' is not a list of objects
     """
+    raw_flags = data.get("flags", [])
+    if not isinstance(raw_flags, list):
+        raise LLMResponseError(f"'flags' must be a list, got {type(raw_flags).__name__}")
+
     flags = []
-    for flag in data.get("flags", []):
-        normalized = {
-            "segment_id": flag.get("segment_id", ""),
-            "reason": flag.get("reason", ""),
-            "review_type": flag.get("review_type", "cultural_advisor"),
-            "severity": flag.get("severity", "review_recommended"),
-        }
-        flags.append(normalized)
+    for i, flag in enumerate(raw_flags):
+        if not isinstance(flag, dict):
+            raise LLMResponseError(f"Flag {i} must be an object, got {type(flag).__name__}")
+        flags.append(
+            {
+                "segment_id": flag.get("segment_id", ""),
+                "reason": flag.get("reason", ""),
+                "review_type": flag.get("review_type", "cultural_advisor"),
+                "severity": flag.get("severity", "review_recommended"),
+            }
+        )
 
     return {"flags": flags}
@@ -7,11 +7,14 @@ prompts/ directory.
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, Template
 
+_TWO_DIGIT = tuple(f"{i:02d}" for i in range(60))
+
 
 class PromptTemplateManager:
     """Manages loading and rendering of prompt templates."""
@@ -76,6 +79,22 @@ class PromptTemplateManager:
         return format_brief_for_prompt(brief)
 
 
+def _format_prompt_segment(seg: dict[str, Any]) -> str:
+    """Format a single enriched segment as a transcript prompt entry."""
+    parts = [
+        f"[{seg.get('segment_id', 'unknown')}] "
+        f"{format_timecode(seg.get('start', 0))} → {format_timecode(seg.get('end', 0))}"
+    ]
+    speaker = seg.get("speaker")
+    if speaker:
+        parts.append(f" | Speaker: {speaker}")
+    delivery_label = seg.get("delivery", {}).get("delivery_label", "")
+    if delivery_label:
+        parts.append(f" | Delivery: {delivery_label}")
+    parts.append(f'\n"{seg.get("text", "").strip()}"\n')
+    return "".join(parts)
+
+
 def format_transcript_for_prompt(segments: list[dict[str, Any]]) -> str:
     """Format enriched segments for LLM prompt.
 
@@ -88,30 +107,7 @@ def format_transcript_for_prompt(segments: list[dict[str, Any]]) -> str:
     Returns:
         Formatted transcript string
     """
-    lines = []
-
-    for seg in segments:
-        segment_id = seg.get("segment_id", "unknown")
-        start = seg.get("start", 0)
-        end = seg.get("end", 0)
-        text = seg.get("text", "").strip()
-        speaker = seg.get("speaker")
-        delivery = seg.get("delivery", {})
-        delivery_label = delivery.get("delivery_label", "")
-
-        start_tc = format_timecode(start)
-        end_tc = format_timecode(end)
-
-        line = f"[{segment_id}] {start_tc} → {end_tc}"
-        if speaker:
-            line += f" | Speaker: {speaker}"
-        if delivery_label:
-            line += f" | Delivery: {delivery_label}"
-        line += f'\n"{text}"\n'
-
-        lines.append(line)
-
-    return "\n".join(lines)
+    return "\n".join([_format_prompt_segment(seg) for seg in segments])
 
 
 LANGUAGE_NAMES: dict[str, str] = {
@@ -200,10 +196,20 @@ def detect_project_language(manifest: dict[str, Any]) -> str | None:
 
 def format_timecode(seconds: float) -> str:
     """Format seconds as HH:MM:SS."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return _format_whole_seconds(int(seconds // 1))
+
+
+@functools.lru_cache(maxsize=65536)
+def _format_whole_seconds(total: int) -> str:
+    """Format a whole number of seconds as HH:MM:SS.
+
+    Segment boundaries are fractional, but whole seconds repeat across a
+    transcript (every end is usually the next start), so the integer
+    form is what gets cached.
+    """
+    hours, rem = divmod(total, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours:02d}:" + _TWO_DIGIT[minutes] + ":" + _TWO_DIGIT[secs]
 
 
 def format_theme_map_for_prompt(themes_data: dict[str, Any]) -> str:
@@ -7,10 +7,17 @@ in interview transcripts.
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# Local servers (Ollama, LM Studio) answer one request at a time, so
+# concurrent calls only queue up and risk timeouts; cloud APIs don't.
+_CONCURRENT_BACKENDS = frozenset({"claude", "openai"})
+_DEFAULT_CLOUD_WORKERS = 4
+
 
 def extract_themes_for_interview(
     segments: dict[str, Any],
@@ -85,9 +92,14 @@ def extract_themes_all_interviews(
     force: bool = False,
     language: str | None = None,
     console=None,
+    max_workers: int | None = None,
 ) -> dict[str, Any]:
     """Extract themes for all interviews in a project.
 
+    LLM calls are network-bound, so interviews are sent from a thread
+    pool; manifest updates and the summary table happen on the calling
+    thread in manifest order.
+
     Args:
         project_path: Path to project directory
         manifest: Project manifest dict
@@ -97,6 +109,8 @@ def extract_themes_all_interviews(
         force: Re-extract even if already done
         language: ISO 639-1 language code for non-English transcripts
         console: Optional rich console for output
+        max_workers: Maximum concurrent LLM requests (default: 4 for cloud
+            backends, 1 for local servers)
 
     Returns:
         Dict with extraction summary
@@ -130,22 +144,33 @@ def extract_themes_all_interviews(
     table.add_column("Themes", style="green")
     table.add_column("Status", style="yellow")
 
+    # One directory listing instead of an exists() call per interview
+    try:
+        with os.scandir(segments_dir) as entries:
+            segment_files = {entry.name for entry in entries}
+    except FileNotFoundError:
+        segment_files = set()
+
+    # Summary rows in manifest order; extraction rows are filled in afterwards
+    rows: list[tuple[str, str, str] | None] = []
+    jobs: list[tuple[int, dict[str, Any], Path]] = []
+
     for interview in manifest.get("interviews", []):
         interview_id = interview["id"]
 
         if not interview["stages"].get("enriched"):
-            table.add_row(interview_id, "-", "[dim]Skipped (not enriched)[/dim]")
+            rows.append((interview_id, "-", "[dim]Skipped (not enriched)[/dim]"))
             results["skipped"] += 1
             continue
 
         if interview["stages"].get("themes") and not force:
-            table.add_row(interview_id, "-", "[dim]Skipped (already extracted)[/dim]")
+            rows.append((interview_id, "-", "[dim]Skipped (already extracted)[/dim]"))
             results["skipped"] += 1
             continue
 
-        segments_path = segments_dir / f"{interview_id}.json"
-        if not segments_path.exists():
-            table.add_row(interview_id, "-", "[red]Segments not found[/red]")
+        segments_name = f"{interview_id}.json"
+        if segments_name not in segment_files:
+            rows.append((interview_id, "-", "[red]Segments not found[/red]"))
             results["failed"] += 1
             results["errors"].append(
                 {
@@ -155,37 +180,51 @@ def extract_themes_all_interviews(
             )
             continue
 
-        try:
-            if console:
-                console.print(f"\n[cyan]Extracting themes for {interview_id}...[/cyan]")
-
-            segments = read_json(segments_path)
-
-            themes = extract_themes_for_interview(
-                segments=segments,
-                client=client,
-                template_manager=template_manager,
-                profile=config.project_profile,
-                brief=brief,
-                language=language,
-                console=console,
-            )
+        jobs.append((len(rows), interview, segments_dir / segments_name))
+        rows.append(None)
 
-            output_path = themes_dir / f"{interview_id}.json"
-            write_json(output_path, themes)
+    if max_workers is None:
+        backend = getattr(client, "backend", None)
+        max_workers = _DEFAULT_CLOUD_WORKERS if backend in _CONCURRENT_BACKENDS else 1
+    workers = max(1, min(max_workers, len(jobs)))
+    # Per-request progress lines are only meaningful when sending one at a time
+    job_console = console if workers == 1 else None
+
+    def _run(job: tuple[int, dict[str, Any], Path]) -> dict[str, Any]:
+        _, interview, segments_path = job
+        interview_id = interview["id"]
+        if console:
+            console.print(f"\n[cyan]Extracting themes for {interview_id}...[/cyan]")
+
+        themes = extract_themes_for_interview(
+            segments=read_json(segments_path),
+            client=client,
+            template_manager=template_manager,
+            profile=config.project_profile,
+            brief=brief,
+            language=language,
+            console=job_console,
+        )
+        write_json(themes_dir / f"{interview_id}.json", themes)
+        return themes
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run, job) for job in jobs]
+
+    # Record outcomes in manifest order so errors and rows stay deterministic
+    for future, (row_index, interview, _) in zip(futures, jobs):
+        interview_id = interview["id"]
+        try:
+            themes = future.result()
 
             interview["stages"]["themes"] = True
 
             theme_count = len(themes.get("themes", []))
-            table.add_row(
-                interview_id,
-                str(theme_count),
-                "[green]✓ Extracted[/green]",
-            )
+            rows[row_index] = (interview_id, str(theme_count), "[green]✓ Extracted[/green]")
             results["extracted"] += 1
 
         except Exception as e:
-            table.add_row(interview_id, "-", f"[red]Error: {e}[/red]")
+            rows[row_index] = (interview_id, "-", f"[red]Error: {e}[/red]")
             results["failed"] += 1
             results["errors"].append(
                 {
@@ -194,6 +233,10 @@ def extract_themes_all_interviews(
                 }
             )
 
+    for row in rows:
+        if row is not None:
+            table.add_row(*row)
+
     if console:
         console.print(table)
         usage = client.get_token_usage()
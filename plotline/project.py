@@ -77,9 +77,10 @@ class Project:
 
     def load_manifest(self) -> dict[str, Any]:
         """Load the project manifest."""
-        if not self.manifest_path.exists():
-            raise FileNotFoundError(f"Manifest not found: {self.manifest_path}")
-        return read_json(self.manifest_path)
+        try:
+            return read_json(self.manifest_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Manifest not found: {self.manifest_path}") from None
 
     def save_manifest(self, manifest: dict[str, Any]) -> None:
         """Save the project manifest."""
@@ -177,11 +178,15 @@ def probe_video(path: Path) -> dict[str, Any]:
 
 
 def generate_interview_id(manifest: dict[str, Any]) -> str:
-    """Generate a unique interview ID."""
-    existing = {i.get("id", "") for i in manifest.get("interviews", [])}
-    counter = 1
-    while True:
-        interview_id = f"interview_{counter:03d}"
-        if interview_id not in existing:
-            return interview_id
-        counter += 1
+    """Generate a unique interview ID, reusing the lowest free number."""
+    used: set[int] = set()
+    for interview in manifest.get("interviews", []):
+        prefix, _, number = interview.get("id", "").partition("_")
+        if prefix != "interview" or not number.isdecimal():
+            continue
+        value = int(number)
+        # Only the zero-padded form we generate can collide with a new ID
+        if f"{value:03d}" == number:
+            used.add(value)
+    counter = next(i for i in range(1, len(used) + 2) if i not in used)
+    return f"interview_{counter:03d}"
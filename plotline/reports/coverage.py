@@ -7,7 +7,9 @@ Identifies coverage gaps and provides per-message analysis.
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from plotline.export.timecode import seconds_to_timecode
@@ -15,6 +17,10 @@ from plotline.io import read_json
 from plotline.reports.generator import ReportGenerator
 from plotline.utils import format_duration, get_delivery_class
 
+# Shared read-only defaults for lookups in the per-segment loops
+_EMPTY: tuple[Any, ...] = ()
+_EMPTY_MAP: MappingProxyType[str, Any] = MappingProxyType({})
+
 
 def build_theme_alignment_map(
     synthesis_data: dict[str, Any] | None,
@@ -35,9 +41,7 @@ def build_theme_alignment_map(
     for theme in synthesis_data.get("unified_themes", []):
         brief_alignment = theme.get("brief_alignment")
         if brief_alignment:
-            if brief_alignment not in alignment_map:
-                alignment_map[brief_alignment] = []
-            alignment_map[brief_alignment].append(theme.get("unified_theme_id", ""))
+            alignment_map.setdefault(brief_alignment, []).append(theme.get("unified_theme_id", ""))
 
     return alignment_map
 
@@ -56,15 +60,52 @@ def build_theme_to_segments_map(
     if not synthesis_data:
         return {}
 
-    theme_segments: dict[str, list[str]] = {}
+    return {
+        theme["unified_theme_id"]: theme["all_segment_ids"]
+        for theme in synthesis_data.get("unified_themes", [])
+        if theme.get("unified_theme_id") and theme.get("all_segment_ids")
+    }
 
-    for theme in synthesis_data.get("unified_themes", []):
-        theme_id = theme.get("unified_theme_id", "")
-        segment_ids = theme.get("all_segment_ids", [])
-        if theme_id and segment_ids:
-            theme_segments[theme_id] = segment_ids
 
-    return theme_segments
+def intern_coverage_ids(
+    selections_data: dict[str, Any],
+    synthesis_data: dict[str, Any] | None,
+) -> None:
+    """Intern the ID strings analyze_coverage joins on, in place.
+
+    Freshly parsed JSON gives every occurrence of an ID its own string
+    object. Interning makes the repeated segment/theme/message IDs share
+    one object, so the many dict and set probes in analyze_coverage hit
+    the identity fast path.
+
+    Args:
+        selections_data: Selections with segments
+        synthesis_data: Optional synthesis with unified_themes
+    """
+    intern = sys.intern
+
+    for seg in selections_data.get("segments", []):
+        for key in ("segment_id", "brief_message"):
+            value = seg.get(key)
+            if isinstance(value, str):
+                seg[key] = intern(value)
+        themes = seg.get("themes")
+        if themes:
+            seg["themes"] = [intern(t) if isinstance(t, str) else t for t in themes]
+
+    if not synthesis_data:
+        return
+
+    for theme in synthesis_data.get("unified_themes", []):
+        for key in ("unified_theme_id", "brief_alignment"):
+            value = theme.get(key)
+            if isinstance(value, str):
+                theme[key] = intern(value)
+        segment_ids = theme.get("all_segment_ids")
+        if segment_ids:
+            theme["all_segment_ids"] = [
+                intern(sid) if isinstance(sid, str) else sid for sid in segment_ids
+            ]
 
 
 def analyze_coverage(
@@ -94,13 +135,17 @@ def analyze_coverage(
 
     segment_by_id = {s.get("segment_id"): s for s in segments}
 
+    segments_by_message: dict[Any, list[dict[str, Any]]] = {}
+    for seg in segments:
+        segments_by_message.setdefault(seg.get("brief_message"), []).append(seg)
+
     messages_data = []
     matrix_columns = []
 
     for seg in segments:
         seg_id = seg.get("segment_id", "")
         interview_id = seg.get("interview_id", "")
-        interview = interviews_map.get(interview_id, {})
+        interview = interviews_map.get(interview_id) or _EMPTY_MAP
         fps = interview.get("frame_rate", 24)
 
         start = seg.get("start", 0)
@@ -124,63 +169,56 @@ def analyze_coverage(
         strong_segments = []
         weak_segments = []
 
-        for seg in segments:
-            seg_id = seg.get("segment_id", "")
-            brief_message = seg.get("brief_message")
+        for seg in segments_by_message.get(msg_id) or _EMPTY:
+            interview_id = seg.get("interview_id", "")
+            interview = interviews_map.get(interview_id) or _EMPTY_MAP
+            fps = interview.get("frame_rate", 24)
+            start = seg.get("start", 0)
+
+            strong_segments.append(
+                {
+                    "segment_id": seg.get("segment_id", ""),
+                    "position": seg.get("position", 0),
+                    "interview_id": interview_id,
+                    "text": seg.get("text", "")[:100],
+                    "timecode": seconds_to_timecode(start, fps),
+                    "delivery_score": seg.get("composite_score", 0),
+                    "delivery_class": get_delivery_class(seg.get("composite_score", 0)),
+                    "audio_path": (
+                        f"../{interview['audio_full_path']}#t={max(0, start - 2)}"
+                        if interview.get("audio_full_path")
+                        else None
+                    ),
+                }
+            )
 
-            if brief_message == msg_id:
+        seen_ids = {s["segment_id"] for s in strong_segments}
+        aligned_theme_ids = theme_alignment_map.get(msg_id, [])
+        for theme_id in aligned_theme_ids:
+            for theme_seg_id in theme_to_segments.get(theme_id) or _EMPTY:
+                if theme_seg_id not in segment_by_id or theme_seg_id in seen_ids:
+                    continue
+                seen_ids.add(theme_seg_id)
+
+                seg = segment_by_id[theme_seg_id]
                 interview_id = seg.get("interview_id", "")
-                interview = interviews_map.get(interview_id, {})
+                interview = interviews_map.get(interview_id) or _EMPTY_MAP
                 fps = interview.get("frame_rate", 24)
                 start = seg.get("start", 0)
-                end = seg.get("end", 0)
 
-                strong_segments.append(
+                weak_segments.append(
                     {
-                        "segment_id": seg_id,
+                        "segment_id": theme_seg_id,
                         "position": seg.get("position", 0),
                         "interview_id": interview_id,
                         "text": seg.get("text", "")[:100],
                         "timecode": seconds_to_timecode(start, fps),
                         "delivery_score": seg.get("composite_score", 0),
                         "delivery_class": get_delivery_class(seg.get("composite_score", 0)),
-                        "audio_path": (
-                            f"../{interview['audio_full_path']}#t={max(0, start - 2)}"
-                            if interview.get("audio_full_path")
-                            else None
-                        ),
+                        "themes": seg.get("themes", []),
                     }
                 )
 
-        aligned_theme_ids = theme_alignment_map.get(msg_id, [])
-        for theme_id in aligned_theme_ids:
-            theme_segment_ids = theme_to_segments.get(theme_id, [])
-            for theme_seg_id in theme_segment_ids:
-                if theme_seg_id in segment_by_id:
-                    seg = segment_by_id[theme_seg_id]
-                    if not any(s["segment_id"] == theme_seg_id for s in strong_segments):
-                        if not any(s["segment_id"] == theme_seg_id for s in weak_segments):
-                            interview_id = seg.get("interview_id", "")
-                            interview = interviews_map.get(interview_id, {})
-                            fps = interview.get("frame_rate", 24)
-                            start = seg.get("start", 0)
-                            end = seg.get("end", 0)
-
-                            weak_segments.append(
-                                {
-                                    "segment_id": theme_seg_id,
-                                    "position": seg.get("position", 0),
-                                    "interview_id": interview_id,
-                                    "text": seg.get("text", "")[:100],
-                                    "timecode": seconds_to_timecode(start, fps),
-                                    "delivery_score": seg.get("composite_score", 0),
-                                    "delivery_class": get_delivery_class(
-                                        seg.get("composite_score", 0)
-                                    ),
-                                    "themes": seg.get("themes", []),
-                                }
-                            )
-
         strong_segments.sort(key=lambda s: s.get("delivery_score", 0), reverse=True)
         weak_segments.sort(key=lambda s: s.get("delivery_score", 0), reverse=True)
 
@@ -213,16 +251,16 @@ def analyze_coverage(
     for msg_data in messages_data:
         row_cells = []
         msg_id = msg_data["id"]
+        aligned_themes = set(msg_data.get("aligned_themes", []))
 
         for col in matrix_columns:
             seg_id = col["segment_id"]
-            seg = segment_by_id.get(seg_id, {})
+            seg = segment_by_id.get(seg_id) or _EMPTY_MAP
 
             if seg.get("brief_message") == msg_id:
                 cell_value = "strong"
             else:
-                seg_themes = seg.get("themes", [])
-                aligned_themes = msg_data.get("aligned_themes", [])
+                seg_themes = seg.get("themes") or _EMPTY
                 if aligned_themes and any(t in aligned_themes for t in seg_themes):
                     cell_value = "weak"
                 else:
@@ -258,17 +296,22 @@ def analyze_coverage(
 
     must_include_status = []
     must_include = brief_data.get("must_include_topics", [])
+    # All theme names in one NUL-separated haystack: each topic is then a
+    # single C-level substring search instead of a Python loop over names.
+    theme_names = (
+        "\0".join(
+            theme.get("name", "").casefold() for theme in synthesis_data.get("unified_themes", [])
+        )
+        if synthesis_data and synthesis_data.get("unified_themes")
+        else None
+    )
     for topic in must_include:
-        found = False
-        if synthesis_data:
-            for theme in synthesis_data.get("unified_themes", []):
-                if topic.lower() in theme.get("name", "").lower():
-                    found = True
-                    break
+        topic_cf = topic.casefold()
+        covered = theme_names is not None and "\0" not in topic_cf and topic_cf in theme_names
         must_include_status.append(
             {
                 "topic": topic,
-                "covered": found,
+                "covered": covered,
             }
         )
 
@@ -347,6 +390,8 @@ def generate_coverage(
     for interview in manifest.get("interviews", []):
         interviews_map[interview.get("id", "")] = interview
 
+    intern_coverage_ids(selections_data, synthesis_data)
+
     coverage_data = analyze_coverage(
         brief_data=brief_data,
         selections_data=selections_data,
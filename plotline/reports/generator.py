@@ -6,13 +6,30 @@ Produces self-contained HTML reports with embedded CSS and JavaScript.
 
 from __future__ import annotations
 
-import json
+import functools
 import webbrowser
 from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+from plotline.io import dumps_json
+
+
+@functools.lru_cache(maxsize=8)
+def _get_environment(template_dir: Path) -> Environment:
+    """Return a shared Environment per template directory.
+
+    Sharing the Environment keeps Jinja's compiled-template cache alive
+    across ReportGenerator instances. Report templates don't change while
+    the process runs, so per-render mtime checks are disabled.
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+    )
+
 
 class ReportGenerator:
     """Jinja2-based HTML report generator."""
@@ -21,10 +38,7 @@ class ReportGenerator:
         if template_dir is None:
             template_dir = Path(__file__).parent / "templates"
 
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+        self.env = _get_environment(Path(template_dir))
 
     def render(
         self,
@@ -53,12 +67,12 @@ class ReportGenerator:
 
         template = self.env.get_template(template_name)
 
-        data_json = json.dumps(data, indent=2, ensure_ascii=False)
+        data_json = dumps_json(data)
 
         html = template.render(data=data, data_json=data_json, **data)
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html, encoding="utf-8")
+        output_path.write_bytes(html.encode("utf-8"))
 
         return output_path
 
@@ -56,35 +56,47 @@ def load_speaker_config(project_path: Path) -> dict[str, dict[str, str]]:
     return get_all_speakers_from_project(project_path)
 
 
-def generate_transcript(
+def _load_segments(segments_path: Path, interview_id: str) -> dict[str, Any]:
+    """Load an interview's enriched segments file.
+
+    Args:
+        segments_path: Path to the interview's segments JSON
+        interview_id: Interview ID, used in the error message
+
+    Returns:
+        Parsed segments data
+
+    Raises:
+        FileNotFoundError: If the interview has not been enriched yet
+    """
+    try:
+        return read_json(segments_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"No segments found for {interview_id}. Run 'plotline enrich' first."
+        ) from None
+
+
+def build_transcript_data(
     project_path: Path,
     manifest: dict[str, Any],
     interview_id: str,
-    output_path: Path | None = None,
-    open_browser: bool = False,
-) -> Path:
-    """Generate the per-interview transcript report.
+) -> dict[str, Any]:
+    """Build the template data for an interview's transcript report.
 
     Args:
         project_path: Path to project directory
         manifest: Project manifest dict
-        interview_id: Interview ID to generate report for
-        output_path: Optional output path
-        open_browser: Whether to open in browser
+        interview_id: Interview ID to build data for
 
     Returns:
-        Path to generated report
-    """
-    if output_path is None:
-        output_path = project_path / "reports" / f"transcript_{interview_id}.html"
+        Dict of template variables for transcript.html
 
+    Raises:
+        FileNotFoundError: If the interview has no segments yet
+    """
     segments_path = project_path / "data" / "segments" / f"{interview_id}.json"
-    if not segments_path.exists():
-        raise FileNotFoundError(
-            f"No segments found for {interview_id}. Run 'plotline enrich' first."
-        )
-
-    segments_data = read_json(segments_path)
+    segments_data = _load_segments(segments_path, interview_id)
     all_segments = segments_data.get("segments", [])
 
     themes_path = project_path / "data" / "themes" / f"{interview_id}.json"
@@ -203,7 +215,7 @@ def generate_transcript(
 
     themes_for_template = [{"name": name, "color": theme_colors[name]} for name in sorted_themes]
 
-    data = {
+    return {
         "project_name": manifest.get("project_name", "Plotline Project"),
         "interview_id": interview_id,
         "source_file": source_file,
@@ -220,6 +232,31 @@ def generate_transcript(
         "has_speakers": has_speakers,
     }
 
+
+def generate_transcript(
+    project_path: Path,
+    manifest: dict[str, Any],
+    interview_id: str,
+    output_path: Path | None = None,
+    open_browser: bool = False,
+) -> Path:
+    """Generate the per-interview transcript report.
+
+    Args:
+        project_path: Path to project directory
+        manifest: Project manifest dict
+        interview_id: Interview ID to generate report for
+        output_path: Optional output path
+        open_browser: Whether to open in browser
+
+    Returns:
+        Path to generated report
+    """
+    if output_path is None:
+        output_path = project_path / "reports" / f"transcript_{interview_id}.html"
+
+    data = build_transcript_data(project_path, manifest, interview_id)
+
     generator = ReportGenerator()
     result_path = generator.render("transcript.html", data, output_path, manifest=manifest)
 
@@ -7,10 +7,13 @@ Produces segment-level transcripts with word-level timestamps.
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+_TWO_DIGIT = tuple(f"{i:02d}" for i in range(60))
+
 
 def transcribe_audio(
     audio_path: Path,
@@ -141,40 +144,44 @@ def _transcribe_cpp(
     raise NotImplementedError("whisper.cpp backend not yet implemented")
 
 
+def _build_word(w: dict[str, Any]) -> dict[str, Any]:
+    """Convert one Whisper word entry into our word format."""
+    word_data = {
+        "word": w["word"] if "word" in w else w.get("text", ""),
+        "start": w.get("start", 0),
+        "end": w.get("end", 0),
+    }
+    if "probability" in w:
+        word_data["probability"] = w["probability"]
+    return word_data
+
+
+def _build_segment(index: int, seg: dict[str, Any]) -> dict[str, Any]:
+    """Convert one Whisper segment (1-based index) into our segment format."""
+    confidence = seg.get("avg_logprob")
+    if confidence is None:
+        confidence = seg.get("confidence", 0)
+    if confidence < 0:
+        confidence = max(0.0, min(1.0, 1 + confidence))
+
+    return {
+        "segment_id": f"seg_{index:03d}",
+        "start": seg.get("start", 0),
+        "end": seg.get("end", 0),
+        "text": seg.get("text", "").strip(),
+        "confidence": round(confidence, 2),
+        "corrected": False,
+        "words": [_build_word(w) for w in seg.get("words", [])],
+    }
+
+
 def _parse_whisper_result(
     result: dict[str, Any],
     model: str,
     language: str | None,
 ) -> dict[str, Any]:
     """Parse Whisper result into our transcript format."""
-    segments = []
-
-    for i, seg in enumerate(result.get("segments", [])):
-        words = []
-        for w in seg.get("words", []):
-            word_data = {
-                "word": w.get("word", w.get("text", "")),
-                "start": w.get("start", 0),
-                "end": w.get("end", 0),
-            }
-            if "probability" in w:
-                word_data["probability"] = w["probability"]
-            words.append(word_data)
-
-        confidence = seg.get("avg_logprob", seg.get("confidence", 0))
-        if confidence < 0:
-            confidence = max(0.0, min(1.0, 1 + confidence))
-
-        segment_data = {
-            "segment_id": f"seg_{i + 1:03d}",
-            "start": seg.get("start", 0),
-            "end": seg.get("end", 0),
-            "text": seg.get("text", "").strip(),
-            "confidence": round(confidence, 2),
-            "corrected": False,
-            "words": words,
-        }
-        segments.append(segment_data)
+    segments = [_build_segment(i, seg) for i, seg in enumerate(result.get("segments", []), 1)]
 
     return {
         "model": model,
@@ -195,6 +202,10 @@ def transcribe_all_interviews(
 ) -> dict[str, Any]:
     """Transcribe all interviews in a project.
 
+    Each transcript is written on a background thread while Whisper works
+    on the next interview; its outcome is recorded once the write has
+    finished, so the summary stays in manifest order.
+
     Args:
         project_path: Path to project directory
         manifest: Project manifest dict
@@ -228,78 +239,96 @@ def transcribe_all_interviews(
     table.add_column("Duration", style="green")
     table.add_column("Status", style="yellow")
 
-    for interview in manifest.get("interviews", []):
-        interview_id = interview["id"]
+    def _fail(interview_id: str, error: str, status: str) -> None:
+        table.add_row(interview_id, "-", "-", status)
+        results["failed"] += 1
+        results["errors"].append(
+            {
+                "interview_id": interview_id,
+                "error": error,
+            }
+        )
 
-        if not interview["stages"].get("extracted"):
-            table.add_row(interview_id, "-", "-", "[dim]Skipped (not extracted)[/dim]")
-            results["skipped"] += 1
-            continue
-
-        if interview["stages"].get("transcribed") and not force:
-            table.add_row(interview_id, "-", "-", "[dim]Skipped (already transcribed)[/dim]")
-            results["skipped"] += 1
-            continue
-
-        audio_path = project_path / interview["audio_16k_path"]
-        if not audio_path.exists():
-            table.add_row(interview_id, "-", "-", "[red]Audio file not found[/red]")
-            results["failed"] += 1
-            results["errors"].append(
-                {
-                    "interview_id": interview_id,
-                    "error": "Audio file not found",
-                }
-            )
-            continue
+    # Transcript whose write is still in flight: (interview, transcript, write)
+    pending: tuple[dict[str, Any], dict[str, Any], Future[None]] | None = None
 
+    def _record_pending() -> None:
+        nonlocal pending
+        if pending is None:
+            return
+        interview, transcript, write = pending
+        pending = None
+        interview_id = interview["id"]
         try:
-            if console:
-                console.print(f"\n[cyan]Transcribing {interview_id}...[/cyan]")
+            write.result()
+        except Exception as e:
+            _fail(interview_id, str(e), f"[red]Error: {e}[/red]")
+            return
+
+        interview["stages"]["transcribed"] = True
+        interview["detected_language"] = transcript.get("language")
+
+        duration = (
+            format_duration(transcript["segments"][-1]["end"]) if transcript["segments"] else "0:00"
+        )
+        table.add_row(
+            interview_id,
+            str(len(transcript["segments"])),
+            duration,
+            "[green]✓ Transcribed[/green]",
+        )
+        results["transcribed"] += 1
+
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        for interview in manifest.get("interviews", []):
+            interview_id = interview["id"]
+
+            if not interview["stages"].get("extracted"):
+                _record_pending()
+                table.add_row(interview_id, "-", "-", "[dim]Skipped (not extracted)[/dim]")
+                results["skipped"] += 1
+                continue
+
+            if interview["stages"].get("transcribed") and not force:
+                _record_pending()
+                table.add_row(interview_id, "-", "-", "[dim]Skipped (already transcribed)[/dim]")
+                results["skipped"] += 1
+                continue
+
+            audio_path = project_path / interview["audio_16k_path"]
+            if not audio_path.exists():
+                _record_pending()
+                _fail(interview_id, "Audio file not found", "[red]Audio file not found[/red]")
+                continue
+
+            try:
+                if console:
+                    console.print(f"\n[cyan]Transcribing {interview_id}...[/cyan]")
+
+                transcript = transcribe_audio(
+                    audio_path=audio_path,
+                    model=model,
+                    language=language,
+                    backend=backend,
+                    console=console,
+                )
 
-            transcript = transcribe_audio(
-                audio_path=audio_path,
-                model=model,
-                language=language,
-                backend=backend,
-                console=console,
-            )
+                transcript["interview_id"] = interview_id
+                transcript["duration_seconds"] = interview.get("duration_seconds", 0)
 
-            transcript["interview_id"] = interview_id
-            transcript["duration_seconds"] = interview.get("duration_seconds", 0)
+                for i, seg in enumerate(transcript["segments"]):
+                    seg["segment_id"] = f"{interview_id}_seg_{i + 1:03d}"
 
-            for i, seg in enumerate(transcript["segments"]):
-                seg["segment_id"] = f"{interview_id}_seg_{i + 1:03d}"
+            except Exception as e:
+                _record_pending()
+                _fail(interview_id, str(e), f"[red]Error: {e}[/red]")
+                continue
 
+            _record_pending()
             output_path = transcripts_dir / f"{interview_id}.json"
-            write_json(output_path, transcript)
-
-            interview["stages"]["transcribed"] = True
-            interview["detected_language"] = transcript.get("language")
-
-            duration = (
-                format_duration(transcript["segments"][-1]["end"])
-                if transcript["segments"]
-                else "0:00"
-            )
-            table.add_row(
-                interview_id,
-                str(len(transcript["segments"])),
-                duration,
-                "[green]✓ Transcribed[/green]",
-            )
-            results["transcribed"] += 1
+            pending = (interview, transcript, writer.submit(write_json, output_path, transcript))
 
-        except Exception as e:
-            table.add_row(interview_id, "-", "-", f"[red]Error: {e}[/red]")
-            results["failed"] += 1
-            results["errors"].append(
-                {
-                    "interview_id": interview_id,
-                    "error": str(e),
-                }
-            )
-            continue
+        _record_pending()
 
     if console:
         console.print(table)
@@ -309,9 +338,8 @@ def transcribe_all_interviews(
 
 def format_duration(seconds: float) -> str:
     """Format seconds as MM:SS or HH:MM:SS."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    hours, rem = divmod(int(seconds // 1), 3600)
+    minutes, secs = divmod(rem, 60)
     if hours > 0:
-        return f"{hours}:{minutes:02d}:{secs:02d}"
-    return f"{minutes}:{secs:02d}"
+        return f"{hours}:" + _TWO_DIGIT[minutes] + ":" + _TWO_DIGIT[secs]
+    return f"{minutes}:" + _TWO_DIGIT[secs]
@@ -6,6 +6,8 @@ Contains common functions used across multiple modules to avoid duplication.
 
 from __future__ import annotations
 
+import functools
+
 
 def format_duration(seconds: float) -> str:
     """Format seconds as HH:MM:SS or MM:SS.
@@ -16,9 +18,18 @@ def format_duration(seconds: float) -> str:
     Returns:
         Formatted string (HH:MM:SS if >= 1 hour, otherwise MM:SS)
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    return _format_whole_duration(int(seconds // 1))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_duration(total: int) -> str:
+    """Format a whole number of seconds as HH:MM:SS or MM:SS.
+
+    Only whole seconds are displayed, so the truncated value is the cache
+    key and fractional durations that round down together share an entry.
+    """
+    hours, rem = divmod(total, 3600)
+    minutes, secs = divmod(rem, 60)
     if hours > 0:
         return f"{hours}:{minutes:02d}:{secs:02d}"
     return f"{minutes}:{secs:02d}"
@@ -60,7 +71,7 @@ def get_delivery_class(score: float) -> str:
 
 
 # Shared theme color palette (12 colors) used across all report templates.
-THEME_COLORS = [
+THEME_COLORS = (
     "#3b82f6",
     "#8b5cf6",
     "#06b6d4",
@@ -73,7 +84,8 @@ THEME_COLORS = [
     "#d946ef",
     "#0ea5e9",
     "#84cc16",
-]
+)
+_THEME_COLOR_COUNT = len(THEME_COLORS)
 
 
 def get_theme_color(index: int) -> str:
@@ -85,4 +97,4 @@ def get_theme_color(index: int) -> str:
     Returns:
         Hex color string
     """
-    return THEME_COLORS[index % len(THEME_COLORS)]
+    return THEME_COLORS[index % _THEME_COLOR_COUNT]
@@ -7,6 +7,7 @@ Validates environment, dependencies, and input files before processing.
 from __future__ import annotations
 
 import shutil
+import stat
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -132,16 +133,18 @@ def validate_video_file(path: Path) -> dict[str, Any]:
     Raises:
         ValidationError: If file doesn't exist or is invalid
     """
-    if not path.exists():
-        raise ValidationError(f"File not found: {path}")
+    try:
+        st = path.stat()
+    except OSError:
+        raise ValidationError(f"File not found: {path}") from None
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ValidationError(f"Not a file: {path}")
 
     return {
         "path": str(path),
         "exists": True,
-        "size_mb": path.stat().st_size // (1024 * 1024),
+        "size_mb": st.st_size // (1024 * 1024),
     }
 
 
@@ -4,16 +4,27 @@ Test configuration and shared fixtures.
 
 from __future__ import annotations
 
+import json
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 import yaml
 
 
-@pytest.fixture
-def tmp_project(tmp_path: Path) -> Path:
-    """Create a temporary project directory with basic structure."""
-    project_dir = tmp_path / "test_project"
+@pytest.fixture(autouse=True, scope="session")
+def _no_browser() -> Iterator[None]:
+    """Never let a report test open a real browser window."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("webbrowser.open", lambda *args, **kwargs: True)
+        yield
+
+
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the basic project layout once per session (per xdist worker)."""
+    project_dir = tmp_path_factory.mktemp("project_template") / "test_project"
     project_dir.mkdir()
     (project_dir / "source").mkdir()
     (project_dir / "data").mkdir()
@@ -31,13 +42,74 @@ def tmp_project(tmp_path: Path) -> Path:
 
     manifest = {"project_name": "test_project", "interviews": []}
     with open(project_dir / "interviews.json", "w") as f:
-        import json
-
         json.dump(manifest, f)
 
     return project_dir
 
 
+@pytest.fixture
+def tmp_project(tmp_path: Path, project_template: Path) -> Path:
+    """Create a temporary project directory with basic structure.
+
+    Each test gets its own copy of the session template, so tests are free
+    to write into it.
+    """
+    project_dir = tmp_path / "test_project"
+    shutil.copytree(project_template, project_dir)
+    return project_dir
+
+
+@pytest.fixture(scope="module")
+def tmp_project_module(tmp_path_factory: pytest.TempPathFactory, project_template: Path) -> Path:
+    """Create one writable project directory shared by a whole test module.
+
+    Tests using it must keep their files apart, e.g. by writing under a
+    distinct interview ID.
+    """
+    project_dir = tmp_path_factory.mktemp("project_module") / "test_project"
+    shutil.copytree(project_template, project_dir)
+    return project_dir
+
+
+@pytest.fixture(scope="session")
+def coverage_project_template(
+    tmp_path_factory: pytest.TempPathFactory, project_template: Path
+) -> Path:
+    """Build a project with brief.json and selections.json once per session."""
+    project_dir = tmp_path_factory.mktemp("coverage_template") / "test_project"
+    shutil.copytree(project_template, project_dir)
+
+    brief = {"key_messages": [{"id": "msg_001", "text": "Test message"}]}
+    with open(project_dir / "brief.json", "w") as f:
+        json.dump(brief, f)
+
+    selections = {
+        "segments": [
+            {
+                "segment_id": "seg_001",
+                "brief_message": "msg_001",
+                "composite_score": 0.85,
+                "text": "Test segment",
+                "start": 0,
+                "end": 10,
+                "position": 1,
+            }
+        ]
+    }
+    with open(project_dir / "data" / "selections.json", "w") as f:
+        json.dump(selections, f)
+
+    return project_dir
+
+
+@pytest.fixture
+def coverage_project(tmp_path: Path, coverage_project_template: Path) -> Path:
+    """Create a writable project copy with a brief and one selected segment."""
+    project_dir = tmp_path / "test_project"
+    shutil.copytree(coverage_project_template, project_dir)
+    return project_dir
+
+
 @pytest.fixture
 def sample_config_dict() -> dict:
     """Return a sample configuration dictionary."""
@@ -120,8 +192,7 @@ def sample_delivery() -> dict:
     }
 
 
-@pytest.fixture
-def sample_segments() -> dict:
+def _build_sample_segments() -> dict:
     """Return a sample enriched segments structure."""
     return {
         "interview_id": "interview_001",
@@ -153,6 +224,28 @@ def sample_segments() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def sample_segments() -> dict:
+    """Return a sample enriched segments structure shared across the session.
+
+    Do not mutate it; tests that need changes should work on a
+    copy.deepcopy() of it.
+    """
+    return _build_sample_segments()
+
+
+@pytest.fixture(scope="session")
+def prebuilt_segments_json(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the sample segments to JSON once per session (per xdist worker).
+
+    Tests copy this file into their own project instead of re-serializing.
+    """
+    path = tmp_path_factory.mktemp("segments") / "interview_001.json"
+    with open(path, "w") as f:
+        json.dump(_build_sample_segments(), f)
+    return path
+
+
 @pytest.fixture
 def sample_manifest() -> dict:
     """Return a sample project manifest."""
@@ -10,6 +10,7 @@ import pytest
 from plotline.brief import (
     normalize_key_messages,
     parse_brief,
+    parse_brief_from_string,
     parse_markdown_brief,
     parse_yaml_brief,
     save_brief,
@@ -65,6 +66,11 @@ class TestNormalizeKeyMessages:
         result = normalize_key_messages([])
         assert result == []
 
+    def test_ids_beyond_precomputed_table(self) -> None:
+        result = normalize_key_messages([f"Message {i}" for i in range(1001)])
+        assert result[999]["id"] == "msg_1000"
+        assert result[1000]["id"] == "msg_1001"
+
 
 class TestParseMarkdownBrief:
     def test_empty_content(self) -> None:
@@ -192,9 +198,9 @@ summary: A summary
 
 
 class TestParseBrief:
-    def test_markdown_file(self, tmp_path: Path) -> None:
-        brief_file = tmp_path / "brief.md"
-        brief_file.write_text(
+    def test_markdown_content(self) -> None:
+        source = Path("briefs") / "brief.md"
+        result = parse_brief_from_string(
             """# Key Messages
 
 - First point
@@ -203,56 +209,54 @@ class TestParseBrief:
 # Audience
 
 General public
-"""
+""",
+            "markdown",
+            "brief",
+            source_file=str(source),
         )
 
-        result = parse_brief(brief_file)
-
         assert len(result["key_messages"]) == 2
         assert result["audience"] == "General public"
-        assert result["source_file"] == str(brief_file)
+        assert result["source_file"] == str(source)
         assert result["name"] == "brief"
 
-    def test_yaml_file(self, tmp_path: Path) -> None:
-        brief_file = tmp_path / "brief.yaml"
-        brief_file.write_text(
+    def test_yaml_content(self) -> None:
+        result = parse_brief_from_string(
             """
 key_messages:
   - First point
   - Second point
 audience: General public
-"""
+""",
+            "yaml",
+            "brief",
         )
 
-        result = parse_brief(brief_file)
-
         assert len(result["key_messages"]) == 2
         assert result["audience"] == "General public"
 
-    def test_yml_extension(self, tmp_path: Path) -> None:
-        brief_file = tmp_path / "brief.yml"
-        brief_file.write_text(
+    def test_yml_format(self) -> None:
+        result = parse_brief_from_string(
             """
 key_messages:
   - Message
-"""
+""",
+            ".yml",
+            "brief",
         )
-
-        result = parse_brief(brief_file)
         assert len(result["key_messages"]) == 1
 
-    def test_key_messages_normalized(self, tmp_path: Path) -> None:
-        brief_file = tmp_path / "brief.md"
-        brief_file.write_text(
+    def test_key_messages_normalized(self) -> None:
+        result = parse_brief_from_string(
             """# Key Messages
 
 - First point
 - Second point
-"""
+""",
+            "markdown",
+            "brief",
         )
 
-        result = parse_brief(brief_file)
-
         assert result["key_messages"][0]["id"] == "msg_001"
         assert result["key_messages"][0]["text"] == "First point"
 
@@ -271,7 +275,7 @@ key_messages:
 
 
 class TestSaveBrief:
-    def test_saves_json_file(self, tmp_path: Path) -> None:
+    def test_saves_json_file_with_iso8601_timestamp(self, tmp_path: Path) -> None:
         brief_data = {
             "key_messages": [{"id": "msg_001", "text": "Test message"}],
             "audience": "Test audience",
@@ -280,23 +284,9 @@ class TestSaveBrief:
         output_path = tmp_path / "brief.json"
         save_brief(brief_data, output_path)
 
-        assert output_path.exists()
-
-        with open(output_path) as f:
-            saved = json.load(f)
+        saved = json.loads(output_path.read_text())
 
         assert saved["key_messages"][0]["text"] == "Test message"
         assert "parsed_at" in saved
-
-    def test_parsed_at_is_iso8601(self, tmp_path: Path) -> None:
-        brief_data = {"key_messages": [{"id": "msg_001", "text": "Test"}]}
-
-        output_path = tmp_path / "brief.json"
-        save_brief(brief_data, output_path)
-
-        with open(output_path) as f:
-            saved = json.load(f)
-
-        assert "parsed_at" in saved
         assert "T" in saved["parsed_at"]
         assert "+" in saved["parsed_at"] or "Z" in saved["parsed_at"]
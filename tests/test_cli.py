@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
 
@@ -69,8 +70,6 @@ class TestAddCommand:
             os.chdir(original_cwd)
 
     def test_add_creates_interview_entry(self, tmp_project: Path) -> None:
-        import json
-
         video_file = tmp_project / "test.mp4"
         video_file.write_bytes(b"fake video content")
 
@@ -11,6 +11,8 @@ from plotline.compare import (
     normalize_scores_cross_interview,
 )
 
+INTERVIEWS_MAP = {"interview_001": {"id": "interview_001", "frame_rate": 24}}
+
 
 class TestCollectAllSegments:
     def test_collect_from_empty_project(self, tmp_project: Path) -> None:
@@ -265,13 +267,12 @@ class TestBuildComparisonGroups:
             }
         }
         cross_scores = {"interview_001_seg_001": 0.85}
-        interviews_map = {"interview_001": {"id": "interview_001", "frame_rate": 24}}
 
         groups = build_comparison_groups(
             synthesis=synthesis,
             segments_by_id=segments_by_id,
             cross_scores=cross_scores,
-            interviews_map=interviews_map,
+            interviews_map=INTERVIEWS_MAP,
         )
 
         assert len(groups) == 1
@@ -317,13 +318,12 @@ class TestBuildComparisonGroups:
         }
         cross_scores = {"seg_001": 0.8, "seg_002": 0.7}
         brief = {"key_messages": ["Water is central to our culture", "Traditions bind us"]}
-        interviews_map = {"interview_001": {"id": "interview_001", "frame_rate": 24}}
 
         groups = build_comparison_groups(
             synthesis=synthesis,
             segments_by_id=segments_by_id,
             cross_scores=cross_scores,
-            interviews_map=interviews_map,
+            interviews_map=INTERVIEWS_MAP,
             brief=brief,
             message_filter="water",
         )
@@ -360,13 +360,12 @@ class TestBuildComparisonGroups:
             }
         }
         cross_scores = {"existing_seg": 0.8}
-        interviews_map = {"interview_001": {"id": "interview_001", "frame_rate": 24}}
 
         groups = build_comparison_groups(
             synthesis=synthesis,
             segments_by_id=segments_by_id,
             cross_scores=cross_scores,
-            interviews_map=interviews_map,
+            interviews_map=INTERVIEWS_MAP,
         )
 
         assert len(groups) == 1
@@ -415,13 +414,12 @@ class TestBuildComparisonGroups:
             },
         }
         cross_scores = {"seg_001": 0.9, "seg_002": 0.8, "seg_003": 0.7}
-        interviews_map = {"interview_001": {"id": "interview_001", "frame_rate": 24}}
 
         groups = build_comparison_groups(
             synthesis=synthesis,
             segments_by_id=segments_by_id,
             cross_scores=cross_scores,
-            interviews_map=interviews_map,
+            interviews_map=INTERVIEWS_MAP,
         )
 
         assert len(groups[0]["candidates"]) == 3
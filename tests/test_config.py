@@ -7,8 +7,11 @@ from pathlib import Path
 import pytest
 
 from plotline.config import (
+    BUILTIN_PROFILES,
     DeliveryWeights,
     PlotlineConfig,
+    _load_yaml_cached,
+    clear_config_cache,
     create_default_config,
     load_config,
     load_profile,
@@ -74,6 +77,15 @@ class TestLoadProfile:
         with pytest.raises(ValueError):
             load_profile("nonexistent")
 
+    def test_repeat_custom_profile_load_returns_copy(self, tmp_path: Path) -> None:
+        (tmp_path / "custom.yaml").write_text("target_duration_seconds: 240\n")
+
+        first = load_profile("custom", tmp_path)
+        first["target_duration_seconds"] = 1
+        second = load_profile("custom", tmp_path)
+
+        assert second["target_duration_seconds"] == 240
+
 
 class TestMergeConfig:
     def test_merge_keeps_project_overrides(self) -> None:
@@ -91,6 +103,13 @@ class TestMergeConfig:
         assert merged["delivery_weights"]["energy"] == 0.5
         assert merged["delivery_weights"]["pause_weight"] == 0.30
 
+    def test_merge_does_not_mutate_profile(self) -> None:
+        project = {"delivery_weights": {"energy": 0.5}, "llm_model": None}
+        profile = {"delivery_weights": {"energy": 0.15}, "llm_model": "base"}
+        merged = merge_config(project, profile)
+        assert profile["delivery_weights"] == {"energy": 0.15}
+        assert merged["llm_model"] == "base"
+
 
 class TestCreateDefaultConfig:
     def test_create_documentary_config(self) -> None:
@@ -115,6 +134,35 @@ class TestLoadConfig:
         with pytest.raises(FileNotFoundError):
             load_config(tmp_path)
 
+    def test_load_config_leaves_builtin_profile_untouched(self, tmp_project: Path) -> None:
+        config_data = create_default_config("test", "documentary")
+        config_data["delivery_weights"] = {"energy": 0.5}
+        write_config(config_data, tmp_project / "plotline.yaml")
+
+        config = load_config(tmp_project)
+
+        assert config.delivery_weights.energy == 0.5
+        assert BUILTIN_PROFILES["documentary"]["delivery_weights"]["energy"] == 0.15
+
+    def test_reload_after_config_change(self, tmp_project: Path) -> None:
+        config_path = tmp_project / "plotline.yaml"
+        write_config(create_default_config("first", "documentary"), config_path)
+        assert load_config(tmp_project).project_name == "first"
+
+        write_config(create_default_config("second-name", "documentary"), config_path)
+        assert load_config(tmp_project).project_name == "second-name"
+
+    def test_cached_parse_is_not_shared(self, tmp_project: Path) -> None:
+        config_path = tmp_project / "plotline.yaml"
+        write_config(create_default_config("test", "documentary"), config_path)
+
+        first = _load_yaml_cached(config_path)
+        first["project_name"] = "mutated"
+        assert _load_yaml_cached(config_path)["project_name"] == "test"
+
+        clear_config_cache()
+        assert _load_yaml_cached(config_path)["project_name"] == "test"
+
 
 class TestDiarizationConfig:
     def test_diarization_defaults(self) -> None:
@@ -11,6 +11,7 @@ from plotline.reports.coverage import (
     build_theme_alignment_map,
     build_theme_to_segments_map,
     generate_coverage,
+    intern_coverage_ids,
 )
 
 
@@ -131,6 +132,35 @@ class TestBuildThemeToSegmentsMap:
         assert result["utheme_001"] == ["seg_001", "seg_002"]
 
 
+class TestInternCoverageIds:
+    def test_ids_share_one_object(self) -> None:
+        """Test repeated IDs from separate JSON documents become one object."""
+        selections_data = json.loads(
+            '{"segments": [{"segment_id": "seg_001", "brief_message": "msg_001",'
+            ' "themes": ["utheme_001"]}]}'
+        )
+        synthesis_data = json.loads(
+            '{"unified_themes": [{"unified_theme_id": "utheme_001",'
+            ' "brief_alignment": "msg_001", "all_segment_ids": ["seg_001"]}]}'
+        )
+
+        intern_coverage_ids(selections_data, synthesis_data)
+
+        seg = selections_data["segments"][0]
+        theme = synthesis_data["unified_themes"][0]
+        assert seg["segment_id"] is theme["all_segment_ids"][0]
+        assert seg["brief_message"] is theme["brief_alignment"]
+        assert seg["themes"][0] is theme["unified_theme_id"]
+
+    def test_handles_missing_fields(self) -> None:
+        """Test segments with null IDs and no synthesis are left intact."""
+        selections_data = {"segments": [{"segment_id": "seg_001", "brief_message": None}]}
+
+        intern_coverage_ids(selections_data, None)
+
+        assert selections_data["segments"][0]["brief_message"] is None
+
+
 class TestAnalyzeCoverage:
     def test_strong_coverage(self) -> None:
         """Test message with direct segment match."""
@@ -197,6 +227,36 @@ class TestAnalyzeCoverage:
         assert result["messages"][0]["coverage_level"] == "weak"
         assert result["weak_count"] == 1
 
+    def test_theme_segments_not_duplicated(self) -> None:
+        """Test segments reachable via several themes or a direct match appear once."""
+        brief_data = {"key_messages": [{"id": "msg_001", "text": "Test message"}]}
+        selections_data = {
+            "segments": [
+                {"segment_id": "seg_001", "brief_message": "msg_001", "composite_score": 0.9},
+                {"segment_id": "seg_002", "brief_message": None, "composite_score": 0.6},
+            ]
+        }
+        synthesis_data = {
+            "unified_themes": [
+                {
+                    "unified_theme_id": "utheme_001",
+                    "brief_alignment": "msg_001",
+                    "all_segment_ids": ["seg_001", "seg_002"],
+                },
+                {
+                    "unified_theme_id": "utheme_002",
+                    "brief_alignment": "msg_001",
+                    "all_segment_ids": ["seg_002", "seg_missing"],
+                },
+            ]
+        }
+
+        result = analyze_coverage(brief_data, selections_data, synthesis_data, None, {})
+
+        message = result["messages"][0]
+        assert [s["segment_id"] for s in message["strong_segments"]] == ["seg_001"]
+        assert [s["segment_id"] for s in message["weak_segments"]] == ["seg_002"]
+
     def test_gap_coverage(self) -> None:
         """Test message with no coverage."""
         brief_data = {
@@ -331,6 +391,19 @@ class TestAnalyzeCoverage:
         assert sustainability is not None
         assert sustainability["covered"] is True
 
+    def test_must_include_does_not_match_across_theme_names(self) -> None:
+        """Test a topic only matches within a single theme name."""
+        brief_data = {
+            "key_messages": [{"id": "msg_001", "text": "Test"}],
+            "must_include_topics": ["water community", "Community"],
+        }
+        synthesis_data = {"unified_themes": [{"name": "Water"}, {"name": "Community"}]}
+
+        result = analyze_coverage(brief_data, {"segments": []}, synthesis_data, None, {})
+
+        covered = {m["topic"]: m["covered"] for m in result["must_include_status"]}
+        assert covered == {"water community": False, "Community": True}
+
 
 class TestGenerateCoverage:
     def test_missing_brief_renders_gracefully(self, tmp_project: Path) -> None:
@@ -354,39 +427,14 @@ class TestGenerateCoverage:
         content = output_path.read_text()
         assert "No Selections Found" in content
 
-    def test_generates_report(self, tmp_project: Path) -> None:
+    def test_generates_report(self, coverage_project: Path) -> None:
         """Test successful report generation."""
-        brief_path = tmp_project / "brief.json"
-        brief_path.write_text(
-            json.dumps({"key_messages": [{"id": "msg_001", "text": "Test message"}]})
-        )
-
-        selections_path = tmp_project / "data" / "selections.json"
-        selections_path.parent.mkdir(parents=True, exist_ok=True)
-        selections_path.write_text(
-            json.dumps(
-                {
-                    "segments": [
-                        {
-                            "segment_id": "seg_001",
-                            "brief_message": "msg_001",
-                            "composite_score": 0.85,
-                            "text": "Test segment",
-                            "start": 0,
-                            "end": 10,
-                            "position": 1,
-                        }
-                    ]
-                }
-            )
-        )
-
         manifest = {
             "project_name": "test-project",
             "interviews": [],
         }
 
-        output_path = generate_coverage(tmp_project, manifest, open_browser=False)
+        output_path = generate_coverage(coverage_project, manifest, open_browser=False)
 
         assert output_path.exists()
         assert output_path.name == "coverage.html"
@@ -396,20 +444,13 @@ class TestGenerateCoverage:
         assert "msg_001" in content
         assert "Test message" in content
 
-    def test_custom_output_path(self, tmp_project: Path) -> None:
+    def test_custom_output_path(self, coverage_project: Path) -> None:
         """Test custom output path."""
-        brief_path = tmp_project / "brief.json"
-        brief_path.write_text(json.dumps({"key_messages": [{"id": "msg_001", "text": "Test"}]}))
-
-        selections_path = tmp_project / "data" / "selections.json"
-        selections_path.parent.mkdir(parents=True, exist_ok=True)
-        selections_path.write_text(json.dumps({"segments": []}))
-
         manifest = {"project_name": "test", "interviews": []}
 
-        custom_path = tmp_project / "custom_coverage.html"
+        custom_path = coverage_project / "custom_coverage.html"
         output_path = generate_coverage(
-            tmp_project, manifest, output_path=custom_path, open_browser=False
+            coverage_project, manifest, output_path=custom_path, open_browser=False
         )
 
         assert output_path == custom_path
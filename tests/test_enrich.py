@@ -144,6 +144,23 @@ class TestMergeTranscriptAndDelivery:
         assert result["segments"][0]["delivery"]["composite_score"] == 0
         assert result["segments"][0]["delivery"]["delivery_label"] == ""
 
+    def test_merge_does_not_mutate_delivery(self) -> None:
+        transcript = {"segments": [{"segment_id": "seg_001", "start": 0.0, "end": 1.0}]}
+        delivery = {
+            "segments": [
+                {
+                    "segment_id": "seg_001",
+                    "normalized": {"energy": 0.5},
+                    "composite_score": 0.7,
+                }
+            ]
+        }
+
+        result = merge_transcript_and_delivery(transcript, delivery)
+
+        assert result["segments"][0]["delivery"]["composite_score"] == 0.7
+        assert delivery["segments"][0]["normalized"] == {"energy": 0.5}
+
     def test_merge_with_metadata(self) -> None:
         """Test merge includes interview metadata."""
         transcript = {
@@ -25,6 +25,8 @@ class TestTimecode:
         assert is_drop_frame_fps(24) is False
         assert is_drop_frame_fps(25) is False
         assert is_drop_frame_fps(30) is False
+        assert is_drop_frame_fps(59.94) is True
+        assert is_drop_frame_fps(30000 / 1001) is True
 
     def test_seconds_to_timecode_24fps(self):
         tc = seconds_to_timecode(0, 24, drop_frame=False)
@@ -94,6 +96,38 @@ class TestTimecode:
         # Must produce 01:00:10;00, not 01:00:13;18 (the old buggy result)
         assert src_tc == "01:00:10;00"
 
+    def test_5994_drop_frame_round_trip(self):
+        """59.94 DF drops four frame numbers per minute except every 10th."""
+        assert seconds_to_timecode(60, 59.94, drop_frame=True) == "00:00:59;56"
+        # Frame 3600 is the first of minute 1, labelled ;04 after the drop
+        assert seconds_to_timecode(3600 * 1001 / 60000, 59.94, drop_frame=True) == "00:01:00;04"
+        assert seconds_to_timecode(3600, 59.94, drop_frame=True) == "01:00:00;00"
+        assert timecode_to_seconds("01:00:00;00", 59.94) == pytest.approx(3600, abs=0.02)
+
+    def test_df_timecode_to_frames_exact(self):
+        """DF timecode to frame counts is exact at long durations."""
+        assert timecode_to_frames("00:01:00;02", 29.97) == 1800
+        assert timecode_to_frames("00:10:00;00", 29.97) == 17982
+        assert timecode_to_frames("01:00:00;00", 29.97) == 107892
+        assert timecode_to_frames("10:00:00;00", 29.97) == 1078920
+        assert timecode_to_frames("25:00:00;00", 29.97) == 25 * 107892
+        assert timecode_to_frames("01:00:00;00", 59.94) == 215784
+
+    def test_df_frames_to_timecode_round_trip(self):
+        """DF frame counts round-trip exactly, including long durations."""
+        for fps in (29.97, 59.94):
+            for frames in (0, 1799, 1800, 17982, 107892, 2_000_003, 10_000_019):
+                tc = frames_to_timecode(frames, fps, drop_frame=True)
+                assert timecode_to_frames(tc, fps) == frames
+        assert frames_to_timecode(1078920, 29.97, drop_frame=True) == "10:00:00;00"
+        assert frames_to_timecode(1800, 29.97, drop_frame=True) == "00:01:00;02"
+
+    def test_timecode_conversions_cached(self):
+        timecode_to_seconds.cache_clear()
+        first = timecode_to_seconds("01:00:00;00", 29.97)
+        assert timecode_to_seconds("01:00:00;00", 29.97) == first
+        assert timecode_to_seconds.cache_info().hits == 1
+
     def test_ndf_23976_frame_accurate(self):
         """Verify 23.976 NDF timecodes are frame-accurate at key boundaries."""
         # Frame 24 at 23.976fps occurs at exactly 1001/24000 * 24 = 1.001 seconds
@@ -681,6 +715,12 @@ class TestFCPXML:
         time_str = seconds_to_fcpxml_time(1.0, 23.976)
         assert "s" in time_str
 
+    def test_seconds_to_fcpxml_time_rational_values(self):
+        assert seconds_to_fcpxml_time(1.0, 24) == "2400/2400s"
+        assert seconds_to_fcpxml_time(1.0, 23.976) == "24024/24000s"
+        assert seconds_to_fcpxml_time(1.0, 23.98) == "24024/24000s"
+        assert seconds_to_fcpxml_time(1.0, 30) == "3000/3000s"
+
     def test_get_fcpxml_format_24fps(self):
         fmt = get_fcpxml_format(24)
         assert fmt["frameDuration"] == "100/2400s"
@@ -691,6 +731,12 @@ class TestFCPXML:
         assert fmt["frameDuration"] == "1001/30000s"
         assert "2997" in fmt["name"]
 
+    def test_get_fcpxml_format_cached_read_only(self):
+        fmt = get_fcpxml_format(25)
+        assert get_fcpxml_format(25) is fmt
+        with pytest.raises(TypeError):
+            fmt["frameDuration"] = "1/1s"  # type: ignore[index]
+
     def test_path_to_file_url(self):
         from pathlib import Path
 
@@ -698,6 +744,12 @@ class TestFCPXML:
         assert url.startswith("file://")
         assert "video.mp4" in url
 
+    def test_path_to_file_url_relative_uses_cwd(self, tmp_path, monkeypatch):
+        from pathlib import Path
+
+        monkeypatch.chdir(tmp_path)
+        assert path_to_file_url(Path("video.mp4")) == (tmp_path / "video.mp4").resolve().as_uri()
+
     def test_generate_fcpxml_basic(self):
         selections = [
             {
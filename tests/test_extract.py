@@ -22,6 +22,11 @@ class TestFormatSize:
     def test_gigabytes(self) -> None:
         assert format_size_path(1610612736) == "1.5 GB"
 
+    def test_unit_boundaries(self) -> None:
+        assert format_size_path(0) == "0.0 B"
+        assert format_size_path(1023) == "1023.0 B"
+        assert format_size_path(1024) == "1.0 KB"
+
     def test_nonexistent_file(self, tmp_path: Path) -> None:
         result = format_size(tmp_path / "nonexistent.wav")
         assert result == "-"
@@ -111,3 +116,82 @@ class TestExtractAllInterviews:
         assert results["extracted"] == 0
         assert results["skipped"] == 1
         assert results["failed"] == 0
+
+    def test_concurrent_extraction_keeps_manifest_order(self, tmp_path: Path) -> None:
+        """Test that concurrent extraction updates interviews and reports errors in order."""
+        from unittest.mock import patch
+
+        from plotline.exceptions import ExtractionError
+        from plotline.extract.audio import extract_all_interviews
+
+        sources = []
+        for i in range(4):
+            source = tmp_path / f"video_{i}.mp4"
+            source.write_bytes(b"")
+            sources.append(source)
+
+        manifest = {
+            "interviews": [
+                {"id": f"interview_{i:03d}", "source_file": str(src), "stages": {}}
+                for i, src in enumerate(sources)
+            ]
+        }
+
+        def fake_extract(source_path, output_16k, output_full, console=None):
+            if source_path.name in ("video_1.mp4", "video_3.mp4"):
+                raise ExtractionError(f"bad {source_path.name}")
+            output_16k.write_bytes(b"x")
+            output_full.write_bytes(b"x")
+            return {"success": True}
+
+        with patch("plotline.extract.audio.extract_audio", side_effect=fake_extract):
+            results = extract_all_interviews(tmp_path, manifest, max_workers=4)
+
+        assert results["extracted"] == 2
+        assert results["failed"] == 2
+        assert [e["interview_id"] for e in results["errors"]] == [
+            "interview_001",
+            "interview_003",
+        ]
+        first = manifest["interviews"][0]
+        assert first["stages"]["extracted"] is True
+        assert first["audio_16k_path"] == "source/interview_000/audio_16k.wav"
+        assert "extracted" not in manifest["interviews"][1]["stages"]
+
+    def test_sequential_by_default(self, tmp_path: Path) -> None:
+        """Test that extraction runs one interview at a time and shows step progress."""
+        import threading
+        from unittest.mock import MagicMock, patch
+
+        from plotline.extract.audio import extract_all_interviews
+
+        manifest = {"interviews": []}
+        for i in range(3):
+            source = tmp_path / f"video_{i}.mp4"
+            source.write_bytes(b"")
+            manifest["interviews"].append(
+                {"id": f"interview_{i:03d}", "source_file": str(source), "stages": {}}
+            )
+
+        console = MagicMock()
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_extract(source_path, output_16k, output_full, console=None):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            assert console is not None
+            output_16k.write_bytes(b"x")
+            output_full.write_bytes(b"x")
+            with lock:
+                active -= 1
+            return {"success": True}
+
+        with patch("plotline.extract.audio.extract_audio", side_effect=fake_extract):
+            results = extract_all_interviews(tmp_path, manifest, console=console)
+
+        assert results["extracted"] == 3
+        assert peak == 1
@@ -112,6 +112,15 @@ class TestFlagSegments:
         result = flag_segments(_make_segments(2), client, tm)
         assert len(result["flags"]) == 2
 
+    def test_malformed_flags_raise(self) -> None:
+        from plotline.exceptions import LLMResponseError
+
+        client = _make_mock_client(["iv_001_seg_001"])  # type: ignore[list-item]
+        tm = _make_mock_template_manager()
+
+        with pytest.raises(LLMResponseError, match="Flag 0 must be an object"):
+            flag_segments(_make_segments(1), client, tm)
+
     def test_console_output_when_provided(self) -> None:
         console = MagicMock()
         client = _make_mock_client([])
@@ -233,6 +242,23 @@ class TestRunFlags:
         # Only the valid flag should be counted
         assert result["flagged"] == 1
 
+    def test_duplicate_flags_counted_once(self, tmp_project: Path) -> None:
+        """Several flags on one segment count as a single flagged segment."""
+        segments = _make_segments(2)
+        _write_selections(tmp_project, segments)
+
+        flags_data = [
+            {"segment_id": "iv_001_seg_001", "reason": "First"},
+            {"segment_id": "iv_001_seg_001", "reason": "Second"},
+        ]
+        config = _make_config(cultural_flags=True)
+        client = _make_mock_client(flags_data)
+        tm = _make_mock_template_manager()
+
+        result = run_flags(tmp_project, {}, client, tm, config)
+
+        assert result["flagged"] == 1
+
     def test_clean_slate_on_rerun(self, tmp_project: Path) -> None:
         """Re-running flags should reset all segments before re-flagging."""
         segments = _make_segments(2)
@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from plotline.io import read_json, read_text, write_json, write_text
+from plotline.io import dumps_json, loads_json, read_json, read_text, write_json, write_text
 
 
 class TestReadJson:
@@ -42,6 +42,62 @@ class TestReadJson:
         with pytest.raises(json.JSONDecodeError):
             read_json(json_file)
 
+    def test_read_json_with_nan(self, tmp_path: Path) -> None:
+        json_file = tmp_path / "nan.json"
+        json_file.write_text('{"score": NaN}')
+
+        result = read_json(json_file)
+
+        assert result["score"] != result["score"]
+
+
+class TestLoadsJson:
+    def test_parses_str_and_bytes(self) -> None:
+        assert loads_json('{"a": "世界"}') == {"a": "世界"}
+        assert loads_json('{"a": "世界"}'.encode()) == {"a": "世界"}
+
+    def test_falls_back_for_nan(self) -> None:
+        result = loads_json(b'{"score": NaN}')
+        assert result["score"] != result["score"]
+
+    def test_invalid_raises(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            loads_json("{not valid json}")
+
+
+class TestDumpsJson:
+    def test_round_trips(self) -> None:
+        data = {"message": "Hello 世界", "nested": {"a": [1, 2.5, None, True]}}
+
+        text = dumps_json(data)
+
+        assert json.loads(text) == data
+        assert "世界" in text
+        assert '\n  "message"' in text
+
+    def test_non_string_keys(self) -> None:
+        assert json.loads(dumps_json({1: "one"})) == {"1": "one"}
+
+    def test_custom_indent(self) -> None:
+        assert '\n    "a"' in dumps_json({"a": 1}, indent=4)
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_non_finite_floats_match_stdlib(
+        self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        import plotline.io
+
+        if not use_orjson:
+            monkeypatch.setattr(plotline.io, "orjson", None)
+        data = {"a": None, "b": [float("nan"), {"c": float("inf"), "d": -float("inf")}]}
+
+        assert dumps_json(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+    def test_null_without_non_finite_floats(self) -> None:
+        data = {"a": None, "b": [1.5, "null"]}
+
+        assert json.loads(dumps_json(data)) == data
+
 
 class TestWriteJson:
     def test_writes_json_file(self, tmp_path: Path) -> None:
@@ -106,6 +162,33 @@ class TestWriteJson:
         assert "🎉" in content
         assert "\\u" not in content
 
+    def test_non_string_keys(self, tmp_path: Path) -> None:
+        output_path = tmp_path / "output.json"
+        write_json(output_path, {1: "one"})
+
+        assert read_json(output_path) == {"1": "one"}
+
+    def test_stdlib_fallback(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import plotline.io
+
+        monkeypatch.setattr(plotline.io, "orjson", None)
+        data = {"message": "Hello 世界", "nested": {"a": [1, 2.5]}}
+
+        output_path = tmp_path / "output.json"
+        write_json(output_path, data)
+
+        assert output_path.read_text(encoding="utf-8") == json.dumps(
+            data, indent=2, ensure_ascii=False
+        )
+
+    def test_nan_round_trips(self, tmp_path: Path) -> None:
+        output_path = tmp_path / "output.json"
+        write_json(output_path, {"score": float("nan")})
+
+        assert "NaN" in output_path.read_text()
+        result = read_json(output_path)
+        assert result["score"] != result["score"]
+
 
 class TestReadText:
     def test_reads_text_file(self, tmp_path: Path) -> None:
@@ -124,6 +207,18 @@ class TestReadText:
 
         assert result == "Hello 世界"
 
+    def test_normalizes_newlines(self, tmp_path: Path) -> None:
+        text_file = tmp_path / "test.txt"
+        text_file.write_bytes(b"one\r\ntwo\rthree\n")
+
+        assert read_text(text_file) == "one\ntwo\nthree\n"
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        text_file = tmp_path / "empty.txt"
+        text_file.write_bytes(b"")
+
+        assert read_text(text_file) == ""
+
     def test_missing_file_raises(self, tmp_path: Path) -> None:
         text_file = tmp_path / "nonexistent.txt"
 
@@ -189,3 +284,36 @@ class TestAtomicWrites:
             result = json.load(f)
 
         assert result == new_data
+
+    def test_concurrent_writers_use_distinct_temp_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import plotline.io
+
+        output_path = tmp_path / "output.txt"
+        real_replace = plotline.io.os.replace
+        tmp_names: list[str] = []
+
+        def replace_after_second_write(src: str, dst: Path) -> None:
+            tmp_names.append(Path(src).name)
+            if len(tmp_names) == 1:
+                # A second writer runs while the first is about to rename
+                write_text(output_path, "second")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(plotline.io.os, "replace", replace_after_second_write)
+        write_text(output_path, "first")
+
+        assert tmp_names[0] != tmp_names[1]
+        assert output_path.read_text() == "first"
+        assert not any(tmp_path.glob("*.tmp"))
+
+    def test_failed_serialization_keeps_existing_file(self, tmp_path: Path) -> None:
+        output_path = tmp_path / "output.json"
+        write_json(output_path, {"old": "data"})
+
+        with pytest.raises(TypeError):
+            write_json(output_path, {"bad": object()})
+
+        assert read_json(output_path) == {"old": "data"}
+        assert not any(tmp_path.glob("*.tmp"))
@@ -13,12 +13,24 @@ class TestParseLLMJson:
         result = parse_llm_json(response)
         assert result["themes"][0]["name"] == "Test"
 
+    def test_parse_clean_json_with_braces_in_strings(self) -> None:
+        """Test parsing clean JSON whose strings contain braces and escapes."""
+        response = '  {"flags": [{"segment_id": "s1", "reason": "uses \\"{sacred}\\" name"}]}\n'
+        result = parse_llm_json(response)
+        assert result["flags"][0]["reason"] == 'uses "{sacred}" name'
+
     def test_parse_json_with_markdown(self) -> None:
         """Test parsing JSON wrapped in markdown."""
         response = '```json\n{"themes": []}\n```'
         result = parse_llm_json(response)
         assert result["themes"] == []
 
+    def test_parse_json_with_bare_fence(self) -> None:
+        """Test parsing JSON in a fence with no language tag."""
+        response = '```\n{"themes": [{"name": "Uses ``` inside"}]}\n```'
+        result = parse_llm_json(response)
+        assert result["themes"][0]["name"] == "Uses ``` inside"
+
     def test_parse_json_with_trailing_commas(self) -> None:
         """Test parsing JSON with trailing commas."""
         response = '{"themes": [{"name": "A",}, {"name": "B",}],}'
@@ -31,6 +43,22 @@ class TestParseLLMJson:
         result = parse_llm_json(response)
         assert result["themes"] == []
 
+    def test_extract_json_skips_braces_in_strings(self) -> None:
+        """Test that braces and escaped quotes inside strings don't end the object."""
+        from plotline.llm.parsing import extract_json_from_response
+
+        response = 'Here you go:\n{"reason": "a \\"}\\" {b}", "n": {"x": 1}} Thanks {!}'
+        assert extract_json_from_response(response) == (
+            '{"reason": "a \\"}\\" {b}", "n": {"x": 1}}'
+        )
+
+    def test_extract_json_unterminated_string_returns_rest(self) -> None:
+        """Test that an unterminated string leaves the object open for repair."""
+        from plotline.llm.parsing import extract_json_from_response
+
+        response = 'Note {"reason": "cut off } here'
+        assert extract_json_from_response(response) == '{"reason": "cut off } here'
+
     def test_parse_truncated_json_with_incomplete_object(self) -> None:
         """Test parsing truncated JSON with incomplete object."""
         response = '{"themes": [{"name": "A"}, {"name": "B", "description": "foo"'
@@ -65,6 +93,26 @@ class TestParseLLMJson:
         result = parse_llm_json(response)
         assert len(result["themes"]) >= 1
 
+    def test_parse_does_not_retry_identical_text(self, monkeypatch) -> None:
+        """Test that repair is reached without re-parsing the same text."""
+        import plotline.llm.parsing as parsing
+
+        attempts: list[str] = []
+        original = parsing.loads_json
+
+        def counting_loads(text):
+            attempts.append(text)
+            return original(text)
+
+        monkeypatch.setattr(parsing, "loads_json", counting_loads)
+
+        assert parse_llm_json('{"themes": [{"name": "A",}],}')["themes"] == [{"name": "A"}]
+        assert len(attempts) == 2
+
+        attempts.clear()
+        parse_llm_json('{"themes": [{"name": "A"}]')
+        assert attempts.count('{"themes": [{"name": "A"}]') == 1
+
 
 class TestValidateThemesResponse:
     def test_validate_basic_response(self) -> None:
@@ -194,6 +242,38 @@ class TestValidateThemesResponse:
         assert result["themes"][0]["segment_ids"] == []
 
 
+class TestValidateSynthesisAndArcResponses:
+    def test_synthesis_defaults_by_position(self) -> None:
+        from plotline.llm.parsing import validate_synthesis_response
+
+        data = {"unified_themes": [{"unified_theme_id": "custom", "name": "A"}, {}]}
+        result = validate_synthesis_response(data)
+        assert [t["unified_theme_id"] for t in result["unified_themes"]] == [
+            "custom",
+            "utheme_002",
+        ]
+        assert result["unified_themes"][1]["name"] == "Unnamed"
+        assert result["best_takes"] == []
+
+    def test_arc_normalizes_items(self) -> None:
+        from plotline.llm.parsing import validate_arc_response
+
+        data = {"arc": [{"segment_id": "iv_001_seg_001"}, {"segment_id": "iv_001_seg_002"}]}
+        result = validate_arc_response(data, target_duration=600)
+        assert [item["position"] for item in result["arc"]] == [1, 2]
+        assert result["arc"][0]["role"] == "unknown"
+        assert result["target_duration_seconds"] == 600
+
+    def test_arc_item_without_segment_id_raises(self) -> None:
+        import pytest
+
+        from plotline.exceptions import LLMResponseError
+        from plotline.llm.parsing import validate_arc_response
+
+        with pytest.raises(LLMResponseError, match="Arc item 1 missing 'segment_id'"):
+            validate_arc_response({"arc": [{"segment_id": "a"}, {"segment_id": ""}]}, 600)
+
+
 class TestFormatTimecode:
     def test_format_seconds(self) -> None:
         assert format_timecode(45) == "00:00:45"
@@ -204,6 +284,22 @@ class TestFormatTimecode:
     def test_format_hours(self) -> None:
         assert format_timecode(3725) == "01:02:05"
 
+    def test_fractional_seconds_truncate(self) -> None:
+        assert format_timecode(59.9) == "00:00:59"
+        assert format_timecode(3599.99) == "00:59:59"
+
+    def test_more_than_99_hours(self) -> None:
+        assert format_timecode(360000 + 61) == "100:01:01"
+
+    def test_cached_per_whole_second(self) -> None:
+        from plotline.llm.templates import _format_whole_seconds
+
+        _format_whole_seconds.cache_clear()
+        assert format_timecode(125.2) == "00:02:05"
+        assert format_timecode(125.9) == "00:02:05"
+        info = _format_whole_seconds.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
 
 class TestFormatTranscriptForPrompt:
     def test_format_empty_segments(self) -> None:
@@ -282,6 +378,27 @@ class TestFormatTranscriptForPrompt:
         assert "Speaker: SPEAKER_01" in result
         assert "Delivery: confident" in result
 
+    def test_format_exact_layout(self) -> None:
+        segments = [
+            {
+                "segment_id": "seg_001",
+                "start": 0.0,
+                "end": 65.5,
+                "text": "  Hello world ",
+                "speaker": "SPEAKER_01",
+                "delivery": {"delivery_label": "confident"},
+            },
+            {"segment_id": "seg_002", "start": 65.5, "end": 70.0, "text": "Bye"},
+        ]
+        result = format_transcript_for_prompt(segments)
+        assert result == (
+            "[seg_001] 00:00:00 → 00:01:05 | Speaker: SPEAKER_01 | Delivery: confident\n"
+            '"Hello world"\n'
+            "\n"
+            "[seg_002] 00:01:05 → 00:01:10\n"
+            '"Bye"\n'
+        )
+
 
 class TestLLMClient:
     def test_privacy_mode_local_blocks_cloud(self) -> None:
@@ -310,3 +427,18 @@ class TestLLMClient:
 
         client = LLMClient(backend="ollama", privacy_mode="local")
         client._check_privacy()
+
+    def test_privacy_rechecked_after_mode_change(self) -> None:
+        """A cached pass must not survive a switch to local mode."""
+        import pytest
+
+        from plotline.exceptions import LLMPrivacyError
+        from plotline.llm.client import LLMClient
+
+        client = LLMClient(backend="claude", privacy_mode="hybrid")
+        client._check_privacy()
+        client._check_privacy()
+
+        client.privacy_mode = "local"
+        with pytest.raises(LLMPrivacyError):
+            client._check_privacy()
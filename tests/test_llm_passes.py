@@ -157,6 +157,69 @@ class TestThemesExtraction:
 
         assert result["extracted"] == 1
 
+    def test_extract_themes_missing_segments(self, tmp_project: Path) -> None:
+        from plotline.llm.themes import extract_themes_all_interviews
+
+        client = _make_mock_client({"themes": []})
+        tm = _make_mock_template_manager()
+        config = _make_mock_config()
+
+        manifest = {"interviews": [{"id": "interview_001", "stages": {"enriched": True}}]}
+
+        result = extract_themes_all_interviews(
+            project_path=tmp_project,
+            manifest=manifest,
+            client=client,
+            template_manager=tm,
+            config=config,
+        )
+
+        assert result["failed"] == 1
+        assert result["errors"] == [
+            {"interview_id": "interview_001", "error": "Segments file not found"}
+        ]
+        client.complete.assert_not_called()
+
+    def test_extract_themes_concurrent_keeps_manifest_order(self, tmp_project: Path) -> None:
+        from plotline.llm.themes import extract_themes_all_interviews
+
+        client = _make_mock_client({"themes": []})
+        tm = _make_mock_template_manager()
+        config = _make_mock_config()
+
+        segments_dir = tmp_project / "data" / "segments"
+        segments_dir.mkdir(parents=True, exist_ok=True)
+        for interview_id in ("interview_001", "interview_003"):
+            (segments_dir / f"{interview_id}.json").write_text(
+                json.dumps({"interview_id": interview_id, "segments": []})
+            )
+        (segments_dir / "interview_002.json").write_text("{not json")
+
+        manifest = {
+            "interviews": [
+                {"id": f"interview_00{i}", "stages": {"enriched": True}} for i in (1, 2, 3)
+            ]
+        }
+
+        result = extract_themes_all_interviews(
+            project_path=tmp_project,
+            manifest=manifest,
+            client=client,
+            template_manager=tm,
+            config=config,
+            max_workers=3,
+        )
+
+        assert result["extracted"] == 2
+        assert result["failed"] == 1
+        assert [e["interview_id"] for e in result["errors"]] == ["interview_002"]
+        assert [i["stages"].get("themes", False) for i in manifest["interviews"]] == [
+            True,
+            False,
+            True,
+        ]
+        assert (tmp_project / "data" / "themes" / "interview_003.json").exists()
+
 
 class TestSynthesis:
     def test_synthesize_themes_empty(self) -> None:
@@ -230,6 +293,40 @@ class TestArcConstruction:
 
         assert result["arc"] == []
 
+    def test_build_narrative_arc_sends_top_scored_candidates(self) -> None:
+        from plotline.llm.arc import build_narrative_arc
+
+        client = _make_mock_client({"arc": []})
+        tm = _make_mock_template_manager()
+        config = _make_mock_config()
+
+        all_segments = [
+            {
+                "segment_id": f"interview_001_seg_{i:03d}",
+                "start": i * 60.0,
+                "end": (i + 1) * 60.0,
+                "delivery": {"composite_score": (i % 7) / 10},
+            }
+            for i in range(150)
+        ]
+        all_segments.append({"segment_id": "interview_001_seg_150", "start": 0.0, "end": 60.0})
+
+        build_narrative_arc(
+            synthesis={},
+            all_segments=all_segments,
+            client=client,
+            template_manager=tm,
+            config=config,
+        )
+
+        (candidates,), _ = tm.format_transcript_for_prompt.call_args
+        expected = sorted(
+            all_segments,
+            key=lambda s: s.get("delivery", {}).get("composite_score", 0),
+            reverse=True,
+        )[:100]
+        assert candidates == expected
+
     def test_build_narrative_arc_selects_segments(self) -> None:
         from plotline.llm.arc import build_narrative_arc
 
@@ -329,6 +426,43 @@ class TestArcConstruction:
         assert len(result["segments"]) == 1
         assert result["segments"][0]["flagged"] is False
 
+    def test_create_selections_joins_by_segment_id(self) -> None:
+        from plotline.llm.arc import create_selections_from_arc
+
+        arc_data = {
+            "arc": [
+                {"segment_id": "iv_002_seg_001", "role": "opening"},
+                {"segment_id": "iv_001_seg_001"},
+                {"segment_id": "missing_seg"},
+                {"role": "no id"},
+            ]
+        }
+        all_segments = [
+            {
+                "segment_id": "iv_001_seg_001",
+                "interview_id": "iv_001",
+                "start": 0.0,
+                "end": 10.0,
+                "delivery": {"composite_score": 0.5, "raw": {"pause_before_sec": 1.5}},
+            },
+            {"segment_id": "iv_002_seg_001", "interview_id": "iv_002", "start": 5.0, "end": 25.0},
+            {"text": "segment without id"},
+        ]
+
+        result = create_selections_from_arc(arc_data, all_segments, "test-project")
+
+        segments = result["segments"]
+        assert [s["segment_id"] for s in segments] == [
+            "iv_002_seg_001",
+            "iv_001_seg_001",
+            "missing_seg",
+        ]
+        assert [s["position"] for s in segments] == [1, 2, 3]
+        assert segments[0]["interview_id"] == "iv_002"
+        assert segments[1]["pause_before_sec"] == 1.5
+        assert segments[2]["start"] == 0 and segments[2]["interview_id"] == ""
+        assert result["estimated_duration_seconds"] == 30.0
+
 
 class TestFlagsPass:
     def test_run_flags_disabled_in_config(self, tmp_project: Path) -> None:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from plotline.project import Project, generate_interview_id, write_json
 
 
@@ -28,6 +30,11 @@ class TestProject:
         manifest = project.load_manifest()
         assert manifest["project_name"] == "test"
 
+    def test_load_missing_manifest_raises(self, tmp_path: Path) -> None:
+        project = Project(tmp_path)
+        with pytest.raises(FileNotFoundError, match="Manifest not found"):
+            project.load_manifest()
+
     def test_get_interview(self, tmp_project: Path) -> None:
         manifest_data = {
             "project_name": "test",
@@ -57,3 +64,28 @@ class TestGenerateInterviewId:
         manifest = {"interviews": [{"id": "interview_001"}, {"id": "interview_003"}]}
         interview_id = generate_interview_id(manifest)
         assert interview_id == "interview_002"
+
+    def test_ignores_non_standard_ids(self) -> None:
+        manifest = {
+            "interviews": [{"id": "interview_001"}, {"id": "custom_002"}, {"id": "interview_x"}]
+        }
+        interview_id = generate_interview_id(manifest)
+        assert interview_id == "interview_002"
+
+    def test_ignores_non_ascii_and_unpadded_numbers(self) -> None:
+        manifest = {
+            "interviews": [
+                {"id": "interview_²"},
+                {"id": "interview_١"},
+                {"id": "interview_1"},
+                {"id": "interview_0002"},
+                {"id": "interview_003"},
+            ]
+        }
+        interview_id = generate_interview_id(manifest)
+        assert interview_id == "interview_001"
+
+    def test_beyond_three_digits(self) -> None:
+        manifest = {"interviews": [{"id": f"interview_{i:03d}"} for i in range(1, 1001)]}
+        interview_id = generate_interview_id(manifest)
+        assert interview_id == "interview_1001"
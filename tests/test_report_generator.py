@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 from plotline.reports import (
     ReportGenerator,
     generate_compare_report,
@@ -173,3 +175,21 @@ class TestNavBarInHtml:
 
         content = output.read_text()
         assert 'aria-label="Report navigation"' in content
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_embedded_data_keeps_nan(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Embedded data_json writes NaN whether or not orjson is installed."""
+        import plotline.io
+
+        if not use_orjson:
+            monkeypatch.setattr(plotline.io, "orjson", None)
+        gen = ReportGenerator()
+        output = tmp_path / "out.html"
+        data: dict[str, Any] = {"project_name": "NaN Test", "avg_score": float("nan")}
+        gen.render("dashboard.html", data, output)
+
+        content = output.read_text()
+        assert '"avg_score": NaN' in content
+        assert '"avg_score": null' not in content
@@ -22,6 +22,9 @@ class TestFormatDuration:
     def test_zero(self) -> None:
         assert format_duration(0) == "0:00"
 
+    def test_fractional_seconds_truncate(self) -> None:
+        assert format_duration(3599.9) == "59:59"
+
 
 class TestParseWhisperResult:
     def test_parse_empty_result(self) -> None:
@@ -136,3 +139,50 @@ class TestTranscribeAllInterviews:
 
         assert results["transcribed"] == 0
         assert results["skipped"] == 1
+
+    def test_writes_in_background_and_records_in_order(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failed transcript write is reported without losing order."""
+        import plotline.io
+        import plotline.transcribe.engine as engine
+
+        def fake_transcribe(audio_path: Path, **kwargs: object) -> dict:
+            return {"language": "en", "segments": [{"start": 0.0, "end": 65.0, "text": "Hi"}]}
+
+        real_write_json = plotline.io.write_json
+
+        def flaky_write_json(path: Path, data: dict, indent: int = 2) -> None:
+            if path.stem == "interview_002":
+                raise OSError("disk full")
+            real_write_json(path, data, indent)
+
+        monkeypatch.setattr(engine, "transcribe_audio", fake_transcribe)
+        monkeypatch.setattr(plotline.io, "write_json", flaky_write_json)
+
+        interviews = []
+        for i in (1, 2, 3):
+            audio = tmp_path / f"audio_{i}.wav"
+            audio.write_bytes(b"")
+            interviews.append(
+                {
+                    "id": f"interview_00{i}",
+                    "audio_16k_path": audio.name,
+                    "stages": {"extracted": True, "transcribed": False},
+                }
+            )
+        interviews.insert(2, {"id": "interview_004", "stages": {"extracted": False}})
+        manifest = {"interviews": interviews}
+
+        results = engine.transcribe_all_interviews(tmp_path, manifest)
+
+        assert results["transcribed"] == 2
+        assert results["skipped"] == 1
+        assert results["errors"] == [{"interview_id": "interview_002", "error": "disk full"}]
+        assert [i["stages"].get("transcribed") for i in interviews] == [True, False, None, True]
+        assert interviews[0]["detected_language"] == "en"
+
+        transcripts_dir = tmp_path / "data" / "transcripts"
+        written = plotline.io.read_json(transcripts_dir / "interview_003.json")
+        assert written["segments"][0]["segment_id"] == "interview_003_seg_001"
+        assert not (transcripts_dir / "interview_002.json").exists()
@@ -2,120 +2,206 @@
 
 from __future__ import annotations
 
-import json
+import copy
+import re
+import shutil
+from collections.abc import Callable
 from pathlib import Path
 
+import pytest
+
+from plotline.io import write_json
 from plotline.reports.transcript import (
     build_theme_map,
+    build_transcript_data,
     generate_transcript,
     get_confidence_class,
-    get_delivery_class,
     get_theme_color,
 )
 
+_NO_DELIVERY_RE = re.compile(rb"No delivery analysis|plotline analyze")
 
-class TestGetDeliveryClass:
-    def test_high_score(self) -> None:
-        assert get_delivery_class(0.8) == "filled"
-        assert get_delivery_class(0.7) == "filled"
-
-    def test_medium_score(self) -> None:
-        assert get_delivery_class(0.5) == "medium"
-        assert get_delivery_class(0.4) == "medium"
 
-    def test_low_score(self) -> None:
-        assert get_delivery_class(0.3) == "low"
-        assert get_delivery_class(0.1) == "low"
+def _assert_all_in(path: Path, needles: list[str]) -> None:
+    """Assert every needle appears in the file, reading it only once."""
+    data = path.read_bytes()
+    missing = [needle for needle in needles if needle.encode() not in data]
+    assert not missing, f"missing {missing}"
 
 
 class TestGetConfidenceClass:
-    def test_high_confidence(self) -> None:
-        assert get_confidence_class(0.95) == "high"
-        assert get_confidence_class(0.9) == "high"
-
-    def test_medium_confidence(self) -> None:
-        assert get_confidence_class(0.8) == "medium"
-        assert get_confidence_class(0.7) == "medium"
-
-    def test_low_confidence(self) -> None:
-        assert get_confidence_class(0.6) == "low"
-        assert get_confidence_class(0.5) == "low"
+    @pytest.mark.parametrize(
+        ("confidence", "expected"),
+        [
+            (0.95, "high"),
+            (0.9, "high"),
+            (0.8, "medium"),
+            (0.7, "medium"),
+            (0.6, "low"),
+            (0.5, "low"),
+        ],
+    )
+    def test_classifies(self, confidence: float, expected: str) -> None:
+        assert get_confidence_class(confidence) == expected
 
 
 class TestGetThemeColor:
-    def test_first_eight_colors(self) -> None:
-        assert get_theme_color(0) == "#3b82f6"
-        assert get_theme_color(1) == "#8b5cf6"
-        assert get_theme_color(7) == "#14b8a6"
-
-    def test_extended_colors(self) -> None:
-        """Theme colors now use shared 12-color palette from utils."""
-        assert get_theme_color(8) == "#6366f1"
-        assert get_theme_color(11) == "#84cc16"
-
-    def test_wraps_around(self) -> None:
-        assert get_theme_color(12) == get_theme_color(0)
-        assert get_theme_color(13) == get_theme_color(1)
+    @pytest.mark.parametrize(
+        ("index", "expected"),
+        [
+            (0, "#3b82f6"),
+            (1, "#8b5cf6"),
+            (7, "#14b8a6"),
+            # Shared 12-color palette from utils
+            (8, "#6366f1"),
+            (11, "#84cc16"),
+            # Wraps around
+            (12, "#3b82f6"),
+            (13, "#8b5cf6"),
+        ],
+    )
+    def test_color(self, index: int, expected: str) -> None:
+        assert get_theme_color(index) == expected
 
 
 class TestBuildThemeMap:
-    def test_empty_themes(self) -> None:
-        result = build_theme_map(None)
-        assert result == {}
-
-    def test_no_themes_key(self) -> None:
-        result = build_theme_map({})
-        assert result == {}
-
-    def test_single_theme_single_segment(self) -> None:
-        themes_data = {
-            "themes": [
-                {
-                    "name": "Connection to water",
-                    "segment_ids": ["interview_001_seg_001"],
-                }
-            ]
-        }
-        result = build_theme_map(themes_data)
-        assert result == {"interview_001_seg_001": ["Connection to water"]}
-
-    def test_multiple_themes_same_segment(self) -> None:
-        themes_data = {
-            "themes": [
+    @pytest.mark.parametrize(
+        ("themes_data", "expected"),
+        [
+            (None, {}),
+            ({}, {}),
+            (
                 {
-                    "name": "Water",
-                    "segment_ids": ["seg_001", "seg_002"],
+                    "themes": [
+                        {"name": "Connection to water", "segment_ids": ["interview_001_seg_001"]}
+                    ]
                 },
+                {"interview_001_seg_001": ["Connection to water"]},
+            ),
+            (
                 {
-                    "name": "Loss",
-                    "segment_ids": ["seg_001"],
-                },
-            ]
-        }
-        result = build_theme_map(themes_data)
-        assert result == {
-            "seg_001": ["Water", "Loss"],
-            "seg_002": ["Water"],
-        }
-
-    def test_multiple_segments_different_themes(self) -> None:
-        themes_data = {
-            "themes": [
-                {
-                    "name": "Theme A",
-                    "segment_ids": ["seg_001", "seg_003"],
+                    "themes": [
+                        {"name": "Water", "segment_ids": ["seg_001", "seg_002"]},
+                        {"name": "Loss", "segment_ids": ["seg_001"]},
+                    ]
                 },
+                {"seg_001": ["Water", "Loss"], "seg_002": ["Water"]},
+            ),
+            (
                 {
-                    "name": "Theme B",
-                    "segment_ids": ["seg_002"],
+                    "themes": [
+                        {"name": "Theme A", "segment_ids": ["seg_001", "seg_003"]},
+                        {"name": "Theme B", "segment_ids": ["seg_002"]},
+                    ]
                 },
+                {"seg_001": ["Theme A"], "seg_002": ["Theme B"], "seg_003": ["Theme A"]},
+            ),
+        ],
+        ids=["empty", "no_key", "single", "multi_same", "multi_diff"],
+    )
+    def test_build_theme_map(
+        self, themes_data: dict | None, expected: dict[str, list[str]]
+    ) -> None:
+        assert build_theme_map(themes_data) == expected
+
+
+@pytest.fixture
+def fake_segments_loader(monkeypatch: pytest.MonkeyPatch) -> Callable[[dict], None]:
+    """Serve segments data to generate_transcript without a file round trip."""
+
+    def install(data: dict) -> None:
+        monkeypatch.setattr(
+            "plotline.reports.transcript._load_segments", lambda path, interview_id: data
+        )
+
+    return install
+
+
+@pytest.fixture(scope="module")
+def rendered_transcript(
+    tmp_path_factory: pytest.TempPathFactory, project_template: Path, prebuilt_segments_json: Path
+) -> tuple[Path, bytes]:
+    """Render the stock transcript report once for read-only assertions."""
+    project_dir = tmp_path_factory.mktemp("rendered_transcript") / "test_project"
+    shutil.copytree(project_template, project_dir)
+    shutil.copy(prebuilt_segments_json, project_dir / "data" / "segments")
+
+    manifest = {
+        "project_name": "test-project",
+        "interviews": [
+            {
+                "id": "interview_001",
+                "filename": "test_video.mov",
+                "frame_rate": 24,
+                "audio_full_path": "source/interview_001/audio_full.wav",
+            }
+        ],
+    }
+
+    output_path = generate_transcript(
+        project_path=project_dir,
+        manifest=manifest,
+        interview_id="interview_001",
+    )
+    return output_path, output_path.read_bytes()
+
+
+class TestBuildTranscriptData:
+    def test_timeline_data(
+        self,
+        tmp_project_module: Path,
+        fake_segments_loader: Callable[[dict], None],
+        sample_segments: dict,
+    ) -> None:
+        fake_segments_loader(sample_segments)
+
+        data = build_transcript_data(tmp_project_module, {}, "interview_001")
+
+        assert data["timeline_data"] == [
+            {
+                "index": 1,
+                "start": 0.0,
+                "end": 5.5,
+                "duration": 5.5,
+                "energy": 0.45,
+                "speech_rate": 0.38,
+                "pitch_variation": 0.72,
+                "pause_weight": 0.15,
+                "spectral_brightness": 0.0,
+                "delivery_score": 0.62,
+            }
+        ]
+
+    def test_audio_path_seeks_before_segment(
+        self,
+        tmp_project_module: Path,
+        fake_segments_loader: Callable[[dict], None],
+        sample_segments: dict,
+    ) -> None:
+        segments_data = copy.deepcopy(sample_segments)
+        segments_data["segments"][0]["start"] = 12.0
+        fake_segments_loader(segments_data)
+        manifest = {
+            "interviews": [
+                {"id": "interview_001", "audio_full_path": "source/interview_001/audio_full.wav"}
             ]
         }
-        result = build_theme_map(themes_data)
-        assert len(result) == 3
-        assert "Theme A" in result["seg_001"]
-        assert "Theme B" in result["seg_002"]
-        assert "Theme A" in result["seg_003"]
+
+        data = build_transcript_data(tmp_project_module, manifest, "interview_001")
+
+        assert data["segments"][0]["audio_path"] == "../source/interview_001/audio_full.wav#t=10.0"
+
+    def test_no_audio_path_without_extracted_audio(
+        self,
+        tmp_project_module: Path,
+        fake_segments_loader: Callable[[dict], None],
+        sample_segments: dict,
+    ) -> None:
+        fake_segments_loader(sample_segments)
+
+        data = build_transcript_data(tmp_project_module, {}, "interview_001")
+
+        assert data["segments"][0]["audio_path"] is None
 
 
 class TestGenerateTranscript:
@@ -126,56 +212,44 @@ class TestGenerateTranscript:
             "interviews": [{"id": "interview_001"}],
         }
 
-        try:
+        with pytest.raises(FileNotFoundError, match="(?i)segments"):
             generate_transcript(
                 project_path=tmp_project,
                 manifest=manifest,
                 interview_id="interview_001",
             )
-            assert False, "Should have raised FileNotFoundError"
-        except FileNotFoundError as e:
-            assert "segments" in str(e).lower()
 
-    def test_generates_report_with_segments(self, tmp_project: Path, sample_segments: dict) -> None:
+    def test_generates_report_with_segments(self, rendered_transcript: tuple[Path, bytes]) -> None:
         """Test report generation with valid segments."""
-        segments_dir = tmp_project / "data" / "segments"
-        with open(segments_dir / "interview_001.json", "w") as f:
-            json.dump(sample_segments, f)
-
-        manifest = {
-            "project_name": "test-project",
-            "interviews": [
-                {
-                    "id": "interview_001",
-                    "filename": "test_video.mov",
-                    "frame_rate": 24,
-                }
-            ],
-        }
-
-        output_path = generate_transcript(
-            project_path=tmp_project,
-            manifest=manifest,
-            interview_id="interview_001",
-            open_browser=False,
-        )
+        output_path, _ = rendered_transcript
 
         assert output_path.exists()
         assert output_path.name == "transcript_interview_001.html"
 
-        content = output_path.read_text()
-        assert "interview_001" in content
-        assert "test_video.mov" in content
-
-    def test_generates_report_with_themes(self, tmp_project: Path, sample_segments: dict) -> None:
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            b"interview_001",
+            b"test_video.mov",
+            b"delivery-timeline",
+            # The template emits the seekable audio source
+            b"audio_full.wav#t=",
+        ],
+    )
+    def test_html_contains(self, rendered_transcript: tuple[Path, bytes], needle: bytes) -> None:
+        _, content = rendered_transcript
+        assert needle in content
+
+    def test_generates_report_with_themes(
+        self, tmp_project_module: Path, prebuilt_segments_json: Path
+    ) -> None:
         """Test report generation includes theme pills."""
-        segments_dir = tmp_project / "data" / "segments"
-        with open(segments_dir / "interview_001.json", "w") as f:
-            json.dump(sample_segments, f)
+        segments_dir = tmp_project_module / "data" / "segments"
+        shutil.copy(prebuilt_segments_json, segments_dir / "interview_101.json")
 
-        themes_dir = tmp_project / "data" / "themes"
+        themes_dir = tmp_project_module / "data" / "themes"
         themes_data = {
-            "interview_id": "interview_001",
+            "interview_id": "interview_101",
             "themes": [
                 {
                     "name": "Connection to water",
@@ -183,14 +257,13 @@ class TestGenerateTranscript:
                 }
             ],
         }
-        with open(themes_dir / "interview_001.json", "w") as f:
-            json.dump(themes_data, f)
+        write_json(themes_dir / "interview_101.json", themes_data)
 
         manifest = {
             "project_name": "test-project",
             "interviews": [
                 {
-                    "id": "interview_001",
+                    "id": "interview_101",
                     "filename": "test_video.mov",
                     "frame_rate": 24,
                 }
@@ -198,20 +271,16 @@ class TestGenerateTranscript:
         }
 
         output_path = generate_transcript(
-            project_path=tmp_project,
+            project_path=tmp_project_module,
             manifest=manifest,
-            interview_id="interview_001",
-            open_browser=False,
+            interview_id="interview_101",
         )
 
-        content = output_path.read_text()
-        assert "Connection to water" in content
+        _assert_all_in(output_path, ["Connection to water"])
 
-    def test_custom_output_path(self, tmp_project: Path, sample_segments: dict) -> None:
+    def test_custom_output_path(self, tmp_project: Path, prebuilt_segments_json: Path) -> None:
         """Test custom output path is respected."""
-        segments_dir = tmp_project / "data" / "segments"
-        with open(segments_dir / "interview_001.json", "w") as f:
-            json.dump(sample_segments, f)
+        shutil.copy(prebuilt_segments_json, tmp_project / "data" / "segments")
 
         manifest = {
             "project_name": "test",
@@ -224,42 +293,20 @@ class TestGenerateTranscript:
             manifest=manifest,
             interview_id="interview_001",
             output_path=custom_path,
-            open_browser=False,
         )
 
         assert output_path == custom_path
         assert custom_path.exists()
 
-    def test_timeline_data_generated(self, tmp_project: Path, sample_segments: dict) -> None:
-        """Test that timeline data is included for waveform."""
-        segments_dir = tmp_project / "data" / "segments"
-        with open(segments_dir / "interview_001.json", "w") as f:
-            json.dump(sample_segments, f)
-
-        manifest = {
-            "project_name": "test",
-            "interviews": [{"id": "interview_001"}],
-        }
-
-        output_path = generate_transcript(
-            project_path=tmp_project,
-            manifest=manifest,
-            interview_id="interview_001",
-            open_browser=False,
-        )
-
-        content = output_path.read_text()
-        assert "timeline_data" in content
-        assert "delivery-timeline" in content
-
-    def test_low_confidence_segment_flagged(self, tmp_project: Path) -> None:
+    def test_low_confidence_segment_flagged(
+        self, tmp_project_module: Path, fake_segments_loader: Callable[[dict], None]
+    ) -> None:
         """Test that low confidence segments get special styling."""
-        segments_dir = tmp_project / "data" / "segments"
         low_confidence_segments = {
-            "interview_id": "interview_001",
+            "interview_id": "interview_102",
             "segments": [
                 {
-                    "segment_id": "interview_001_seg_001",
+                    "segment_id": "interview_102_seg_001",
                     "start": 0.0,
                     "end": 5.0,
                     "text": "Unclear transcription",
@@ -268,59 +315,30 @@ class TestGenerateTranscript:
                 }
             ],
         }
-        with open(segments_dir / "interview_001.json", "w") as f:
-            json.dump(low_confidence_segments, f)
+        fake_segments_loader(low_confidence_segments)
 
         manifest = {
             "project_name": "test",
-            "interviews": [{"id": "interview_001"}],
+            "interviews": [{"id": "interview_102"}],
         }
 
         output_path = generate_transcript(
-            project_path=tmp_project,
+            project_path=tmp_project_module,
             manifest=manifest,
-            interview_id="interview_001",
-            open_browser=False,
+            interview_id="interview_102",
         )
 
-        content = output_path.read_text()
-        assert "low-confidence" in content
+        _assert_all_in(output_path, ["low-confidence"])
 
-    def test_audio_path_constructed(self, tmp_project: Path, sample_segments: dict) -> None:
-        """Test audio path is correctly constructed."""
-        segments_dir = tmp_project / "data" / "segments"
-        with open(segments_dir / "interview_001.json", "w") as f:
-            json.dump(sample_segments, f)
-
-        manifest = {
-            "project_name": "test",
-            "interviews": [
-                {
-                    "id": "interview_001",
-                    "audio_full_path": "source/interview_001/audio_full.wav",
-                }
-            ],
-        }
-
-        output_path = generate_transcript(
-            project_path=tmp_project,
-            manifest=manifest,
-            interview_id="interview_001",
-            open_browser=False,
-        )
-
-        content = output_path.read_text()
-        assert "audio_full.wav" in content
-        assert "#t=" in content
-
-    def test_no_delivery_shows_notice(self, tmp_project: Path) -> None:
+    def test_no_delivery_shows_notice(
+        self, tmp_project_module: Path, fake_segments_loader: Callable[[dict], None]
+    ) -> None:
         """Test that missing delivery shows appropriate notice."""
-        segments_dir = tmp_project / "data" / "segments"
         no_delivery_segments = {
-            "interview_id": "interview_001",
+            "interview_id": "interview_103",
             "segments": [
                 {
-                    "segment_id": "interview_001_seg_001",
+                    "segment_id": "interview_103_seg_001",
                     "start": 0.0,
                     "end": 5.0,
                     "text": "Just text",
@@ -329,33 +347,30 @@ class TestGenerateTranscript:
                 }
             ],
         }
-        with open(segments_dir / "interview_001.json", "w") as f:
-            json.dump(no_delivery_segments, f)
+        fake_segments_loader(no_delivery_segments)
 
         manifest = {
             "project_name": "test",
-            "interviews": [{"id": "interview_001"}],
+            "interviews": [{"id": "interview_103"}],
         }
 
         output_path = generate_transcript(
-            project_path=tmp_project,
+            project_path=tmp_project_module,
             manifest=manifest,
-            interview_id="interview_001",
-            open_browser=False,
+            interview_id="interview_103",
         )
 
-        content = output_path.read_text()
-        assert "No delivery analysis" in content or "plotline analyze" in content
+        assert _NO_DELIVERY_RE.search(output_path.read_bytes())
 
-    def test_hidden_delivery_metrics_surfaced(self, tmp_project: Path) -> None:
+    def test_hidden_delivery_metrics_surfaced(
+        self, tmp_project_module: Path, fake_segments_loader: Callable[[dict], None]
+    ) -> None:
         """Test that hidden delivery metrics (pitch, pause, brightness) are in the report."""
-        segments_dir = tmp_project / "data" / "segments"
-        segments_dir.mkdir(parents=True, exist_ok=True)
         segments_with_metrics = {
-            "interview_id": "interview_001",
+            "interview_id": "interview_104",
             "segments": [
                 {
-                    "segment_id": "interview_001_seg_001",
+                    "segment_id": "interview_104_seg_001",
                     "start": 0.0,
                     "end": 5.0,
                     "text": "Metrics test",
@@ -371,22 +386,24 @@ class TestGenerateTranscript:
                 }
             ],
         }
-        with open(segments_dir / "interview_001.json", "w") as f:
-            json.dump(segments_with_metrics, f)
+        fake_segments_loader(segments_with_metrics)
 
-        manifest = {"project_name": "test", "interviews": [{"id": "interview_001"}]}
+        manifest = {"project_name": "test", "interviews": [{"id": "interview_104"}]}
 
         output_path = generate_transcript(
-            project_path=tmp_project,
+            project_path=tmp_project_module,
             manifest=manifest,
-            interview_id="interview_001",
-            open_browser=False,
+            interview_id="interview_104",
         )
 
-        content = output_path.read_text()
-        assert "Pitch Variation" in content
-        assert "82%" in content
-        assert "Pause Weight" in content
-        assert "15%" in content
-        assert "Spectral Brightness" in content
-        assert "91%" in content
+        _assert_all_in(
+            output_path,
+            [
+                "Pitch Variation",
+                "82%",
+                "Pause Weight",
+                "15%",
+                "Spectral Brightness",
+                "91%",
+            ],
+        )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from plotline.utils import (
     THEME_COLORS,
     format_duration,
@@ -12,51 +14,43 @@ from plotline.utils import (
 
 
 class TestFormatDuration:
-    def test_seconds_only(self) -> None:
-        assert format_duration(45.0) == "0:45"
-
-    def test_minutes_and_seconds(self) -> None:
-        assert format_duration(125.0) == "2:05"
-
-    def test_hours_minutes_seconds(self) -> None:
-        assert format_duration(3725.0) == "1:02:05"
-
-    def test_exact_hour(self) -> None:
-        assert format_duration(3600.0) == "1:00:00"
-
-    def test_zero(self) -> None:
-        assert format_duration(0.0) == "0:00"
-
-    def test_large_duration(self) -> None:
-        assert format_duration(7384.0) == "2:03:04"
-
-    def test_float_seconds(self) -> None:
-        assert format_duration(90.7) == "1:30"
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [
+            (45.0, "0:45"),
+            (125.0, "2:05"),
+            (3725.0, "1:02:05"),
+            (3600.0, "1:00:00"),
+            (0.0, "0:00"),
+            (7384.0, "2:03:04"),
+            (90.7, "1:30"),
+            (3599.9, "59:59"),
+        ],
+        ids=repr,
+    )
+    def test_formats(self, seconds: float, expected: str) -> None:
+        assert format_duration(seconds) == expected
 
 
 class TestGetDeliveryClass:
-    def test_high_score(self) -> None:
-        assert get_delivery_class(0.85) == "filled"
-        assert get_delivery_class(0.7) == "filled"
-        assert get_delivery_class(1.0) == "filled"
-
-    def test_medium_score(self) -> None:
-        assert get_delivery_class(0.5) == "medium"
-        assert get_delivery_class(0.4) == "medium"
-        assert get_delivery_class(0.69) == "medium"
-
-    def test_low_score(self) -> None:
-        assert get_delivery_class(0.1) == "low"
-        assert get_delivery_class(0.0) == "low"
-        assert get_delivery_class(0.39) == "low"
-
-    def test_boundary_at_07(self) -> None:
-        assert get_delivery_class(0.7) == "filled"
-        assert get_delivery_class(0.699) == "medium"
-
-    def test_boundary_at_04(self) -> None:
-        assert get_delivery_class(0.4) == "medium"
-        assert get_delivery_class(0.399) == "low"
+    @pytest.mark.parametrize(
+        ("score", "expected"),
+        [
+            (1.0, "filled"),
+            (0.85, "filled"),
+            (0.7, "filled"),
+            (0.699, "medium"),
+            (0.69, "medium"),
+            (0.5, "medium"),
+            (0.4, "medium"),
+            (0.399, "low"),
+            (0.39, "low"),
+            (0.1, "low"),
+            (0.0, "low"),
+        ],
+    )
+    def test_classifies(self, score: float, expected: str) -> None:
+        assert get_delivery_class(score) == expected
 
 
 class TestFormatDurationFriendly:
@@ -102,19 +96,10 @@ class TestThemeColors:
 
 
 class TestGetThemeColor:
-    def test_first_color(self) -> None:
-        assert get_theme_color(0) == "#3b82f6"
-
-    def test_last_color(self) -> None:
-        assert get_theme_color(11) == "#84cc16"
-
-    def test_wraps_around(self) -> None:
-        assert get_theme_color(12) == get_theme_color(0)
-        assert get_theme_color(13) == get_theme_color(1)
-
-    def test_large_index(self) -> None:
-        assert get_theme_color(120) == get_theme_color(0)
+    @pytest.mark.parametrize(("index", "expected"), [(0, "#3b82f6"), (11, "#84cc16")])
+    def test_palette_ends(self, index: int, expected: str) -> None:
+        assert get_theme_color(index) == expected
 
-    def test_each_index_returns_from_palette(self) -> None:
-        for i in range(12):
-            assert get_theme_color(i) == THEME_COLORS[i]
+    @pytest.mark.parametrize("index", [*range(12), 12, 13, 120])
+    def test_index_maps_into_palette(self, index: int) -> None:
+        assert get_theme_color(index) == THEME_COLORS[index % 12]
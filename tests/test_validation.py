@@ -13,14 +13,16 @@ from plotline.validation import (
 
 
 class TestEstimateAudioSize:
-    def test_short_audio(self):
-        size = estimate_audio_size(60)
-        assert size < 2
-
-    def test_one_hour_audio(self):
-        size = estimate_audio_size(3600)
-        assert size > 100
-        assert size < 150
+    @pytest.mark.parametrize(
+        ("seconds", "min_mb", "max_mb"),
+        [
+            (60, 0, 2),
+            (3600, 100, 150),
+        ],
+        ids=["one_minute", "one_hour"],
+    )
+    def test_estimate_audio_size(self, seconds, min_mb, max_mb):
+        assert min_mb < estimate_audio_size(seconds) < max_mb
 
     def test_custom_sample_rate(self):
         size_16k = estimate_audio_size(60, sample_rate=16000)
@@ -46,23 +48,34 @@ class TestValidateInterviewDuration:
         assert len(result["warnings"]) == 1
         assert "long" in result["warnings"][0].lower()
 
-    def test_duration_formatting_minutes(self):
-        result = validate_interview_duration(185)
-        assert "3m" in result["duration_formatted"]
-
-    def test_duration_formatting_hours(self):
-        result = validate_interview_duration(3725)
-        assert "1h" in result["duration_formatted"]
+    @pytest.mark.parametrize(
+        ("seconds", "needle"),
+        [
+            (185, "3m"),
+            (3725, "1h"),
+        ],
+        ids=["minutes", "hours"],
+    )
+    def test_duration_formatting(self, seconds, needle):
+        result = validate_interview_duration(seconds)
+        assert needle in result["duration_formatted"]
 
 
 class TestValidateVideoFile:
-    def test_nonexistent_file(self):
-        with pytest.raises(ValidationError):
-            validate_video_file(Path("/nonexistent/video.mp4"))
-
-    def test_directory_not_file(self, tmp_path):
-        with pytest.raises(ValidationError):
-            validate_video_file(tmp_path)
+    @pytest.mark.parametrize(
+        ("make_path", "match"),
+        [
+            (lambda tmp: Path("/nonexistent/video.mp4"), "not found"),
+            (lambda tmp: tmp, "Not a file"),
+            (lambda tmp: tmp / "clip.mp4" / "video.mp4", "not found"),
+        ],
+        ids=["missing", "directory", "under_a_file"],
+    )
+    def test_invalid_path_raises(self, tmp_path, make_path, match):
+        (tmp_path / "clip.mp4").write_text("fake video")
+
+        with pytest.raises(ValidationError, match=match):
+            validate_video_file(make_path(tmp_path))
 
     def test_valid_file(self, tmp_path):
         video_file = tmp_path / "test.mp4"